@@ -19,7 +19,6 @@ import unittest
 from pyvcloud.system_test_framework.environment import Environment
 from pyvcloud.vcd.vcd_client import VcdClient
 from pyvcloud.vcd.client import BasicLoginCredentials
-import yaml
 
 
 class ApiBaseTestCase(unittest.TestCase):
@@ -30,10 +29,7 @@ class ApiBaseTestCase(unittest.TestCase):
     def setUpClass(cls):
         if 'VCD_TEST_BASE_CONFIG_FILE' in os.environ:
             cls._config_file = os.environ['VCD_TEST_BASE_CONFIG_FILE']
-        with open(cls._config_file, 'r') as f:
-            cls._config_yaml = yaml.safe_load(f)
-
-        Environment.init(cls._config_yaml)
+        cls._config_yaml = Environment.load_config(cls._config_file)
         cls._logger = Environment.get_default_logger()
         cls._client = cls._create_client_with_credentials()
         if not cls._client:
@@ -17,7 +17,6 @@ import os
 import unittest
 
 from pyvcloud.system_test_framework.environment import Environment
-import yaml
 
 
 class BaseTestCase(unittest.TestCase):
@@ -28,24 +27,8 @@ class BaseTestCase(unittest.TestCase):
     def setUpClass(cls):
         if 'VCD_TEST_BASE_CONFIG_FILE' in os.environ:
             cls._config_file = os.environ['VCD_TEST_BASE_CONFIG_FILE']
-        with open(cls._config_file, 'r') as f:
-            cls._config_yaml = yaml.safe_load(f)
-
-        Environment.init(cls._config_yaml)
-        Environment.attach_vc()
-        Environment.create_pvdc()
-        Environment.create_external_network()
-        Environment.create_org()
-        Environment.create_users()
-        Environment.create_ovdc()
-        Environment.create_direct_ovdc_network()
-        Environment.create_advanced_gateway()
-        Environment.create_ovdc_network()
-        Environment.create_routed_ovdc_network()
-        Environment.create_catalog()
-        Environment.share_catalog()
-        Environment.upload_template()
-        Environment.upload_media()
+        cls._config_yaml = Environment.load_config(cls._config_file)
+        Environment.setup_fixtures()
 
     @classmethod
     def tearDownClass(cls):
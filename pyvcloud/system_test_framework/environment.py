@@ -13,11 +13,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import atexit
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from enum import Enum
+import functools
+import json
 import logging
+import os
+import tempfile
+import threading
 import warnings
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
 from helpers.portgroup_helper import PortgroupHelper
 from pyvcloud.system_test_framework.constants.gateway_constants import \
@@ -39,6 +55,7 @@ from pyvcloud.vcd.system import System
 from pyvcloud.vcd.vapp import VApp
 from pyvcloud.vcd.vdc import VDC
 from pyvcloud.vcd.utils import cidr_to_netmask
+from pyvcloud.vcd.utils import get_non_admin_href
 
 
 def developerModeAware(function):
@@ -60,12 +77,33 @@ def developerModeAware(function):
             function(self)
         else:
             Environment.get_default_logger().debug(
-                'Skipping ' + function.__name__ +
-                ' because developer mode is on.')
+                'Skipping %s because developer mode is on.',
+                function.__name__)
 
     return wrapper
 
 
+def _index_by_name(records):
+    """Index a list of records by their lower cased name.
+
+    Each record's name is read and lower cased exactly once, records without
+    a name are skipped.
+
+    :param list records: records (XML elements or dicts) with a 'name'
+        attribute.
+
+    :return: the records keyed by their lower cased name.
+
+    :rtype: dict
+    """
+    index = {}
+    for record in records:
+        name = record.get('name')
+        if name:
+            index[name.lower()] = record
+    return index
+
+
 class CommonRoles(Enum):
     CATALOG_AUTHOR = 'Catalog Author'
     CONSOLE_ACCESS_ONLY = 'Console Access Only'
@@ -77,9 +115,18 @@ class CommonRoles(Enum):
 class Environment(object):
     _config = None
     _logger = None
+    _http_adapter = None
+    _client_factory = None
 
     _sys_admin_client = None
     _org_admin_client = None
+    _catalog_author_client = None
+    _system = None
+    _platform = None
+    _sys_admin_org = None
+    # Guards the lazy creation of the three objects above, setup steps may
+    # run concurrently.
+    _sys_admin_objects_lock = threading.Lock()
     _pvdc_href = None
     _pvdc_name = None
     _external_network_href = None
@@ -88,6 +135,10 @@ class Environment(object):
     _ovdc_href = None
     _vapp_href = None
     _media_resource = None
+    _catalog_records_cache = None
+    _catalog_items_cache = {}
+    # Guards the two caches above, setup steps may run concurrently.
+    _catalog_cache_lock = threading.Lock()
     _portgroupType = "DV_PORTGROUP"
 
     _user_name_for_roles = {
@@ -100,6 +151,146 @@ class Environment(object):
 
     _user_href_for_user_names = {}
 
+    # Setup steps run by setup_fixtures(), each mapped to the steps whose
+    # results it depends on.
+    _setup_step_dependencies = {
+        'attach_vc': [],
+        'create_pvdc': ['attach_vc'],
+        'create_external_network': ['attach_vc'],
+        'create_org': [],
+        'create_users': ['create_org'],
+        'create_ovdc': ['create_pvdc', 'create_users'],
+        'create_direct_ovdc_network': [
+            'create_ovdc', 'create_external_network'
+        ],
+        'create_advanced_gateway': ['create_ovdc', 'create_external_network'],
+        'create_ovdc_network': ['create_ovdc'],
+        'create_routed_ovdc_network': ['create_advanced_gateway'],
+        'create_catalog': ['create_users'],
+        'share_catalog': ['create_catalog'],
+        'upload_template': ['create_catalog'],
+        'upload_media': ['create_catalog']
+    }
+
+    @classmethod
+    def load_config(cls, config_file):
+        """Loads the configuration file and initializes Environment with it.
+
+        A json copy of the parsed yaml is kept next to the configuration file
+        (<config_file>.json) along with the modification time and size of the
+        yaml file it was made from. The copy is read instead of the yaml file
+        as long as both still match the yaml file exactly; otherwise, or if
+        the copy can't be read, the yaml file is parsed and the copy is
+        rewritten. Writing of the json copy can be turned off by setting
+        'cache_config' to False in the 'global' section of the configuration
+        file.
+
+        :param str config_file: path of the yaml configuration file.
+
+        :return: a dict containing configuration information.
+
+        :rtype: dict
+        """
+        cache_file = config_file + '.json'
+        config_stat = os.stat(config_file)
+        config_data = cls._read_config_cache(cache_file, config_stat)
+
+        if config_data is not None:
+            cls.init(config_data)
+            return config_data
+
+        with open(config_file, 'r') as f:
+            config_data = yaml.load(f, Loader=SafeLoader)
+        cls.init(config_data)
+        if config_data['global'].get('cache_config', True):
+            cls._write_config_cache(cache_file, config_stat, config_data)
+        return config_data
+
+    @classmethod
+    def _read_config_cache(cls, cache_file, config_stat):
+        """Reads the json copy of the configuration used by load_config().
+
+        The copy is only a speed-up, so a missing, unreadable, malformed or
+        stale copy is treated as absent.
+
+        :param str cache_file: path of the json copy.
+        :param os.stat_result config_stat: stat of the yaml configuration
+            file the copy should have been made from.
+
+        :return: the parsed configuration, or None if the copy can't be used.
+
+        :rtype: dict
+        """
+        if not os.path.exists(cache_file):
+            return None
+        try:
+            with open(cache_file, 'r') as f:
+                cache_data = json.load(f)
+        except (OSError, ValueError) as e:
+            # Runs before init(), so get_default_logger() can't be used yet.
+            logging.getLogger('pyvcloud.system_tests').debug(
+                'Failed to read config cache %s: %s', cache_file, e)
+            return None
+        if not isinstance(cache_data, dict) or \
+           cache_data.get('yaml_mtime_ns') != config_stat.st_mtime_ns or \
+           cache_data.get('yaml_size') != config_stat.st_size:
+            return None
+        return cache_data.get('config')
+
+    @classmethod
+    def _write_config_cache(cls, cache_file, config_stat, config_data):
+        """Writes the json copy of the configuration used by load_config().
+
+        The copy is only a speed-up, so failing to write it (e.g. read-only
+        directory, full disk) is logged and otherwise ignored. It is also
+        skipped if the configuration doesn't survive a json round trip
+        unchanged (e.g. yaml timestamps, non string keys), so that runs
+        reading the copy always see the same configuration as the yaml file.
+        The data is written to a uniquely named temporary file first, so that
+        concurrent writers never see or produce a partial file.
+
+        :param str cache_file: path of the json copy.
+        :param os.stat_result config_stat: stat of the yaml configuration
+            file config_data was parsed from.
+        :param dict config_data: the parsed configuration.
+        """
+        cache_data = {
+            'yaml_mtime_ns': config_stat.st_mtime_ns,
+            'yaml_size': config_stat.st_size,
+            'config': config_data
+        }
+        try:
+            serialized_cache_data = json.dumps(cache_data)
+            round_trips = \
+                json.loads(serialized_cache_data)['config'] == config_data
+        except (TypeError, ValueError):
+            round_trips = False
+        if not round_trips:
+            cls._logger.debug(
+                'Not writing config cache %s, the configuration can\'t be '
+                'represented in json.', cache_file)
+            return
+
+        tmp_file = None
+        try:
+            fd, tmp_file = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(cache_file)),
+                prefix=os.path.basename(cache_file) + '.',
+                suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                f.write(serialized_cache_data)
+            os.replace(tmp_file, cache_file)
+            tmp_file = None
+        except OSError as e:
+            cls._logger.debug('Failed to write config cache %s: %s',
+                              cache_file, e)
+        finally:
+            if tmp_file is not None and os.path.exists(tmp_file):
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+
     @classmethod
     def init(cls, config_data):
         """Initializer for Environment class.
@@ -112,7 +303,33 @@ class Environment(object):
         if not cls._config['connection']['verify'] and \
            cls._config['connection']['disable_ssl_warnings']:
             requests.packages.urllib3.disable_warnings()
+        # Logging out clients can leave unclosed sockets behind, which
+        # triggers ResourceWarnings while running unittest.
+        warnings.filterwarnings('ignore', category=ResourceWarning)
         cls._logger = cls.get_default_logger()
+        if cls._http_adapter is None:
+            # Shared by all clients created by get_client(), so that new
+            # clients reuse pooled connections instead of doing a fresh TCP
+            # and TLS handshake. It outlives cleanup(), so that test classes
+            # run in the same process share it too, and is closed once at
+            # interpreter exit.
+            cls._http_adapter = HTTPAdapter(
+                pool_connections=16,
+                pool_maxsize=32,
+                max_retries=Retry(connect=3, read=0, backoff_factor=0.5))
+            atexit.register(cls._close_http_adapter)
+        # The connection settings don't change during a run, so bind them
+        # once instead of looking them up for every client.
+        cls._client_factory = functools.partial(
+            Client,
+            cls._config['vcd']['host'],
+            api_version=cls._config['vcd']['api_version'],
+            verify_ssl_certs=cls._config['connection']['verify'],
+            log_file=cls._config['logging']['default_client_log_filename'],
+            log_requests=cls._config['logging']['log_requests'],
+            log_headers=cls._config['logging']['log_headers'],
+            log_bodies=cls._config['logging']['log_bodies'],
+            http_adapter=cls._http_adapter)
 
     @classmethod
     def get_config(cls):
@@ -134,20 +351,23 @@ class Environment(object):
         """
         if cls._logger is None:
             cls._logger = logging.getLogger('pyvcloud.system_tests')
-            cls._logger.setLevel(logging.DEBUG)
+            cls._logger.propagate = False
             if not cls._logger.handlers:
                 log_file = cls._config['logging']['default_log_filename']
                 if log_file is not None:
+                    cls._logger.setLevel(logging.DEBUG)
                     handler = logging.FileHandler(log_file)
+                    formatter = logging.Formatter('%(asctime)-23.23s | '
+                                                  '%(levelname)-5.5s | '
+                                                  '%(name)-15.15s | '
+                                                  '%(module)-15.15s | '
+                                                  '%(funcName)-30.30s | '
+                                                  '%(message)s')
+                    handler.setFormatter(formatter)
                 else:
+                    # Nothing gets logged, so don't even create debug records.
+                    cls._logger.setLevel(logging.WARNING)
                     handler = logging.NullHandler()
-                formatter = logging.Formatter('%(asctime)-23.23s | '
-                                              '%(levelname)-5.5s | '
-                                              '%(name)-15.15s | '
-                                              '%(module)-15.15s | '
-                                              '%(funcName)-30.30s | '
-                                              '%(message)s')
-                handler.setFormatter(formatter)
                 cls._logger.addHandler(handler)
         return cls._logger
 
@@ -162,6 +382,57 @@ class Environment(object):
         if cls._sys_admin_client is None:
             cls._sys_admin_client = cls.get_sys_admin_client()
 
+    @classmethod
+    def _get_system(cls):
+        """Gets the System object of the sys admin client.
+
+        The object, and the admin resource backing it, are created on first
+        use and reused until cleanup() is called.
+
+        :return: a System object.
+
+        :rtype: pyvcloud.vcd.system.System
+        """
+        with cls._sys_admin_objects_lock:
+            if cls._system is None:
+                cls._system = System(
+                    cls._sys_admin_client,
+                    admin_resource=cls._sys_admin_client.get_admin())
+            return cls._system
+
+    @classmethod
+    def _get_platform(cls):
+        """Gets the Platform object of the sys admin client.
+
+        The object is created on first use and reused until cleanup() is
+        called.
+
+        :return: a Platform object.
+
+        :rtype: pyvcloud.vcd.platform.Platform
+        """
+        with cls._sys_admin_objects_lock:
+            if cls._platform is None:
+                cls._platform = Platform(cls._sys_admin_client)
+            return cls._platform
+
+    @classmethod
+    def _get_sys_admin_org(cls):
+        """Gets the test organization as seen by the sys admin client.
+
+        The object is created on first use and reused until cleanup() is
+        called.
+
+        :return: the organization in which all tests will run.
+
+        :rtype: pyvcloud.vcd.org.Org
+        """
+        with cls._sys_admin_objects_lock:
+            if cls._sys_admin_org is None:
+                cls._sys_admin_org = Org(
+                    cls._sys_admin_client, href=cls._org_href)
+            return cls._sys_admin_org
+
     @classmethod
     def get_sys_admin_client(cls):
         """Creates a sys admin client.
@@ -205,6 +476,22 @@ class Environment(object):
 
         return cls.get_client(org=org, username=username, password=password)
 
+    @classmethod
+    def _get_catalog_author_client(cls):
+        """Gets a client for the catalog author of the test organization.
+
+        The client is logged in on first use and stays logged in until
+        cleanup() is called.
+
+        :return: a client with the catalog author logged in.
+
+        :rtype: pyvcloud.vcd.client.Client
+        """
+        if cls._catalog_author_client is None:
+            cls._catalog_author_client = cls.get_client_in_default_org(
+                CommonRoles.CATALOG_AUTHOR)
+        return cls._catalog_author_client
+
     @classmethod
     def get_client(cls, org, username, password):
         """Returns a client for a particular user.
@@ -225,15 +512,7 @@ class Environment(object):
         if cls._config is None:
             raise Exception('Missing base configuration.')
 
-        client = Client(
-            cls._config['vcd']['host'],
-            api_version=cls._config['vcd']['api_version'],
-            verify_ssl_certs=cls._config['connection']['verify'],
-            log_file=cls._config['logging']['default_client_log_filename'],
-            log_requests=cls._config['logging']['log_requests'],
-            log_headers=cls._config['logging']['log_headers'],
-            log_bodies=cls._config['logging']['log_bodies'])
-
+        client = cls._client_factory()
         client.set_credentials(BasicLoginCredentials(username, org, password))
 
         return client
@@ -245,12 +524,11 @@ class Environment(object):
         If VC is already attached no further action is taken.
         """
         cls._basic_check()
-        platform = Platform(cls._sys_admin_client)
+        platform = cls._get_platform()
         vc_name = cls._config['vc']['vcenter_host_name']
-        for record in platform.list_vcenters():
-            if record.get('name').lower() == vc_name.lower():
-                cls._logger.debug(vc_name + ' is already attached.')
-                return
+        if vc_name.lower() in _index_by_name(platform.list_vcenters()):
+            cls._logger.debug('%s is already attached.', vc_name)
+            return
         platform.attach_vcenter(
             vc_server_name=vc_name,
             vc_server_host=cls._config['vc']['vcenter_host_ip'],
@@ -272,24 +550,21 @@ class Environment(object):
         cls._basic_check()
         pvdc_name = cls._config['vcd']['default_pvdc_name']
 
-        system = System(
-            cls._sys_admin_client,
-            admin_resource=cls._sys_admin_client.get_admin())
-
-        pvdc_refs = system.list_provider_vdcs()
-        if pvdc_name is not '*':
-            for pvdc_ref in pvdc_refs:
-                if pvdc_ref.get('name').lower() == pvdc_name.lower():
-                    cls._logger.debug('Reusing existing ' + pvdc_name)
-                    cls._pvdc_href = pvdc_ref.get('href')
-                    cls._pvdc_name = pvdc_name
-                    return
-            cls._logger.debug('Creating new pvdc' + pvdc_name)
+        pvdc_refs = cls._get_system().list_provider_vdcs()
+        if pvdc_name != '*':
+            pvdc_ref = _index_by_name(pvdc_refs).get(pvdc_name.lower())
+            if pvdc_ref is not None:
+                cls._logger.debug('Reusing existing %s', pvdc_name)
+                cls._pvdc_href = pvdc_ref.get('href')
+                cls._pvdc_name = pvdc_name
+                return
+            cls._logger.debug('Creating new pvdc %s', pvdc_name)
             # TODO(VCDA-603) : use create pvdc code
         else:
             if len(pvdc_refs) > 0:
-                cls._logger.debug('Defaulting to first pvdc in the system : ' +
-                                  pvdc_refs[0].get('name'))
+                cls._logger.debug(
+                    'Defaulting to first pvdc in the system : %s',
+                    pvdc_refs[0].get('name'))
                 cls._pvdc_href = pvdc_refs[0].get('href')
                 cls._pvdc_name = pvdc_refs[0].get('name')
             else:
@@ -319,7 +594,7 @@ class Environment(object):
         primary_dns_ip = '8.8.8.8'
         secondary_dns_ip = '8.8.8.9'
         dns_suffix = 'example.com'
-        platform = Platform(cls._sys_admin_client)
+        platform = cls._get_platform()
         ext_net = platform.create_external_network(
             name=ext_config['name'],
             vim_server_name=vc_name,
@@ -346,24 +621,24 @@ class Environment(object):
         cls._basic_check()
         net_name = cls._config['external_network']['name']
 
-        platform = Platform(cls._sys_admin_client)
+        platform = cls._get_platform()
 
         net_refs = platform.list_external_networks()
-        if net_name is not '*':
-            for net_ref in net_refs:
-                if net_ref.get('name').lower() == net_name.lower():
-                    cls._logger.debug('Reusing existing ' + net_name)
-                    cls._external_network_href = net_ref.get('href')
-                    cls._external_network_name = net_name
-                    return
-            cls._logger.debug('Creating new external network' + net_name)
+        if net_name != '*':
+            net_ref = _index_by_name(net_refs).get(net_name.lower())
+            if net_ref is not None:
+                cls._logger.debug('Reusing existing %s', net_name)
+                cls._external_network_href = net_ref.get('href')
+                cls._external_network_name = net_name
+                return
+            cls._logger.debug('Creating new external network %s', net_name)
             ext_nw = cls._create_external_network()
             cls._external_network_href = ext_nw.get('href')
             cls._external_network_name = net_name
-            cls._logger.debug('Created external network ' + net_name)
+            cls._logger.debug('Created external network %s', net_name)
         else:
             if len(net_refs) > 0:
-                cls._logger.debug('Defaulting to first network : ' +
+                cls._logger.debug('Defaulting to first network : %s',
                                   net_refs[0].get('name'))
                 cls._external_network_href = net_refs[0].get('href')
                 cls._external_network_name = net_refs[0].get('name')
@@ -379,24 +654,22 @@ class Environment(object):
         href of the org as class variable for future use.
         """
         cls._basic_check()
-        system = System(
-            cls._sys_admin_client,
-            admin_resource=cls._sys_admin_client.get_admin())
         org_name = cls._config['vcd']['default_org_name']
-        org_resource_list = cls._sys_admin_client.get_org_list()
-        for org_resource in org_resource_list:
-            if org_resource.get('name').lower() == org_name.lower():
-                cls._logger.debug('Reusing existing org ' + org_name + '.')
-                cls._org_href = org_resource.get('href')
-                return
-        cls._logger.debug('Creating new org ' + org_name)
-        system.create_org(
+        # get_org_list() would fetch every org in the system just to compare
+        # names, get_org_by_name() only fetches the one we are looking for.
+        try:
+            org_resource = cls._sys_admin_client.get_org_by_name(org_name)
+            cls._logger.debug('Reusing existing org %s.', org_name)
+            cls._org_href = org_resource.get('href')
+            return
+        except EntityNotFoundException:
+            pass
+        cls._logger.debug('Creating new org %s', org_name)
+        org_resource = cls._get_system().create_org(
             org_name=org_name, full_org_name=org_name, is_enabled=True)
-        # The following contraption is required to get the non admin href of
-        # the org. The result of create_org() contains the admin version of
-        # the href, since we created the org as a sys admin.
-        org_resource = cls._sys_admin_client.get_org_by_name(org_name)
-        cls._org_href = org_resource.get('href')
+        # The result of create_org() contains the admin version of the href,
+        # since we created the org as a sys admin.
+        cls._org_href = get_non_admin_href(org_resource.get('href'))
 
     @classmethod
     def create_users(cls):
@@ -411,18 +684,19 @@ class Environment(object):
             raise Exception('Org ' + cls._config['vcd']['default_org_name'] +
                             ' doesn\'t exist.')
 
-        org = Org(cls._sys_admin_client, href=cls._org_href)
-        for role_enum in cls._user_name_for_roles.keys():
-            user_name = cls._user_name_for_roles[role_enum]
-            user_records = list(
-                org.list_users(name_filter=('name', user_name)))
-            if len(user_records) > 0:
-                cls._logger.debug('Reusing existing user ' + user_name + '.')
+        org = cls._get_sys_admin_org()
+        # Fetch all users of the org in one query, instead of querying for
+        # each user separately.
+        existing_users = _index_by_name(org.list_users())
+        for role_enum, user_name in cls._user_name_for_roles.items():
+            user_record = existing_users.get(user_name.lower())
+            if user_record is not None:
+                cls._logger.debug('Reusing existing user %s.', user_name)
                 cls._user_href_for_user_names[user_name] = \
-                    user_records[0].get('href')
+                    user_record.get('href')
                 continue
             role = org.get_role_record(role_enum.value)
-            cls._logger.debug('Creating user ' + user_name + '.')
+            cls._logger.debug('Creating user %s.', user_name)
             user_resource = org.create_user(
                 user_name=user_name,
                 password=cls._config['vcd']['default_org_user_password'],
@@ -456,13 +730,13 @@ class Environment(object):
                 CommonRoles.ORGANIZATION_ADMINISTRATOR)
         org = Org(cls._org_admin_client, href=cls._org_href)
         ovdc_name = cls._config['vcd']['default_ovdc_name']
-        for vdc in org.list_vdcs():
-            if vdc.get('name').lower() == ovdc_name.lower():
-                cls._logger.debug('Reusing existing ovdc ' + ovdc_name + '.')
-                cls._ovdc_href = vdc.get('href')
-                return
+        vdc = _index_by_name(org.list_vdcs()).get(ovdc_name.lower())
+        if vdc is not None:
+            cls._logger.debug('Reusing existing ovdc %s.', ovdc_name)
+            cls._ovdc_href = vdc.get('href')
+            return
 
-        org = Org(cls._sys_admin_client, href=cls._org_href)
+        org = cls._get_sys_admin_org()
         storage_profiles = [{
             'name':
             cls._config['vcd']['default_storage_profile_name'],
@@ -476,12 +750,9 @@ class Environment(object):
             True
         }]
 
-        system = System(
-            cls._sys_admin_client,
-            admin_resource=cls._sys_admin_client.get_admin())
-        netpool_to_use = cls._get_netpool_name_to_use(system)
+        netpool_to_use = cls._get_netpool_name_to_use(cls._get_system())
 
-        cls._logger.debug('Creating ovdc ' + ovdc_name + '.')
+        cls._logger.debug('Creating ovdc %s.', ovdc_name)
         vdc_resource = org.create_org_vdc(
             ovdc_name,
             cls._pvdc_name,
@@ -494,13 +765,9 @@ class Environment(object):
         cls._sys_admin_client.get_task_monitor().wait_for_success(
             task=vdc_resource.Tasks.Task[0])
 
-        org = Org(cls._org_admin_client, href=cls._org_href)
-        # The following contraption is required to get the non admin href of
-        # the ovdc. vdc_resource contains the admin version of the href since
-        # we created the ovdc as a sys admin.
-        for vdc in org.list_vdcs():
-            if vdc.get('name').lower() == ovdc_name.lower():
-                cls._ovdc_href = vdc.get('href')
+        # vdc_resource contains the admin version of the href since we
+        # created the ovdc as a sys admin.
+        cls._ovdc_href = get_non_admin_href(vdc_resource.get('href'))
 
     @classmethod
     def _get_netpool_name_to_use(cls, system):
@@ -517,14 +784,13 @@ class Environment(object):
         netpools = system.list_network_pools()
         netpool_to_use = None
         netpool_name = cls._config['vcd']['default_netpool_name']
-        if netpool_name is not '*':
-            for item in netpools:
-                if item.get('name').lower() == netpool_name.lower():
-                    netpool_to_use = item.get('name')
-                    break
+        if netpool_name != '*':
+            item = _index_by_name(netpools).get(netpool_name.lower())
+            if item is not None:
+                netpool_to_use = item.get('name')
 
         if netpool_to_use is None:
-            cls._logger.debug('Using first netpool in system : ' +
+            cls._logger.debug('Using first netpool in system : %s',
                               netpools[0].get('name'))
             netpool_to_use = netpools[0].get('name')
 
@@ -550,13 +816,12 @@ class Environment(object):
         expected_net_name = cls._config['vcd']['default_ovdc_network_name']
         records_list = vdc.list_orgvdc_network_records()
 
-        for network_record in records_list:
-            if network_record['name'].lower() == expected_net_name.lower():
-                cls._logger.debug('Reusing existing org-vdc network ' +
-                                  expected_net_name)
-                return
+        if expected_net_name.lower() in _index_by_name(records_list):
+            cls._logger.debug('Reusing existing org-vdc network %s',
+                              expected_net_name)
+            return
 
-        cls._logger.debug('Creating org-vdc network ' + expected_net_name)
+        cls._logger.debug('Creating org-vdc network %s', expected_net_name)
         result = vdc.create_isolated_vdc_network(
             network_name=expected_net_name,
             network_cidr=cls._config['vcd']
@@ -586,13 +851,12 @@ class Environment(object):
             'default_direct ovdc_network_name']
         records_list = vdc.list_orgvdc_network_records()
 
-        for network_record in records_list:
-            if network_record['name'].lower() == expected_net_name.lower():
-                cls._logger.debug('Reusing existing direct org-vdc network ' +
-                                  expected_net_name)
-                return
+        if expected_net_name.lower() in _index_by_name(records_list):
+            cls._logger.debug('Reusing existing direct org-vdc network %s',
+                              expected_net_name)
+            return
 
-        cls._logger.debug('Creating direct org-vdc network ' +
+        cls._logger.debug('Creating direct org-vdc network %s',
                           expected_net_name)
         result = vdc.create_directly_connected_vdc_network(
             network_name=expected_net_name,
@@ -624,11 +888,10 @@ class Environment(object):
         expected_net_name = OvdcNetConstants.routed_net_name
         records_list = vdc.list_orgvdc_network_records()
 
-        for network_record in records_list:
-            if network_record['name'].lower() == expected_net_name.lower():
-                cls._logger.debug('Reusing existing direct org-vdc network ' +
-                                  expected_net_name)
-                return
+        if expected_net_name.lower() in _index_by_name(records_list):
+            cls._logger.debug('Reusing existing direct org-vdc network %s',
+                              expected_net_name)
+            return
 
         result = vdc.create_routed_vdc_network(
             network_name=OvdcNetConstants.routed_net_name,
@@ -639,6 +902,46 @@ class Environment(object):
         cls._sys_admin_client.get_task_monitor() \
             .wait_for_success(task=result.Tasks.Task[0])
 
+    @classmethod
+    def _list_catalogs(cls, org):
+        """Lists the catalogs in the test organization.
+
+        The listing is fetched once and reused until cleanup() is called.
+        Catalogs created by the Environment are added to it.
+
+        :param pyvcloud.vcd.org.Org org: the test organization.
+
+        :return: catalog records.
+
+        :rtype: list
+        """
+        with cls._catalog_cache_lock:
+            if cls._catalog_records_cache is None:
+                cls._catalog_records_cache = list(org.list_catalogs())
+            return cls._catalog_records_cache
+
+    @classmethod
+    def _list_catalog_items(cls, org, catalog_name):
+        """Lists the items in a catalog of the test organization.
+
+        The listing is fetched once per catalog and reused until cleanup() is
+        called. Items uploaded by the Environment are added to it. Concurrent
+        callers get the same list, so that none of the additions are lost.
+
+        :param pyvcloud.vcd.org.Org org: the test organization.
+        :param str catalog_name: name of the catalog.
+
+        :return: a list of dictionaries, each containing the 'name' and 'id'
+            of a catalog item.
+
+        :rtype: list
+        """
+        with cls._catalog_cache_lock:
+            if catalog_name not in cls._catalog_items_cache:
+                cls._catalog_items_cache[catalog_name] = \
+                    org.list_catalog_items(catalog_name)
+            return cls._catalog_items_cache[catalog_name]
+
     @classmethod
     def create_catalog(cls):
         """Creates a catalog by the name specified in the configuration  file.
@@ -652,25 +955,20 @@ class Environment(object):
             raise Exception('Org ' + cls._config['vcd']['default_org_name'] +
                             ' doesn\'t exist.')
 
-        try:
-            catalog_author_client = Environment.get_client_in_default_org(
-                CommonRoles.CATALOG_AUTHOR)
-            org = Org(catalog_author_client, href=cls._org_href)
-            catalog_name = cls._config['vcd']['default_catalog_name']
-            catalog_records = org.list_catalogs()
-            for catalog_record in catalog_records:
-                if catalog_record.get('name') == catalog_name:
-                    cls._logger.debug('Reusing existing catalog ' +
-                                      catalog_name)
-                    return
-
-            cls._logger.debug('Creating new catalog ' + catalog_name)
-            catalog_resource = org.create_catalog(
-                name=catalog_name, description='')
-            catalog_author_client.get_task_monitor().wait_for_success(
-                task=catalog_resource.Tasks.Task[0])
-        finally:
-            catalog_author_client.logout()
+        catalog_author_client = cls._get_catalog_author_client()
+        org = Org(catalog_author_client, href=cls._org_href)
+        catalog_name = cls._config['vcd']['default_catalog_name']
+        catalog_records = cls._list_catalogs(org)
+        if catalog_name.lower() in _index_by_name(catalog_records):
+            cls._logger.debug('Reusing existing catalog %s', catalog_name)
+            return
+
+        cls._logger.debug('Creating new catalog %s', catalog_name)
+        catalog_resource = org.create_catalog(
+            name=catalog_name, description='')
+        catalog_author_client.get_task_monitor().wait_for_success(
+            task=catalog_resource.Tasks.Task[0])
+        catalog_records.append(catalog_resource)
 
     @classmethod
     def share_catalog(cls):
@@ -685,23 +983,17 @@ class Environment(object):
             raise Exception('Org ' + cls._config['vcd']['default_org_name'] +
                             ' doesn\'t exist.')
 
-        try:
-            catalog_author_client = Environment.get_client_in_default_org(
-                CommonRoles.CATALOG_AUTHOR)
-            org = Org(catalog_author_client, href=cls._org_href)
-            catalog_name = cls._config['vcd']['default_catalog_name']
-            catalog_records = org.list_catalogs()
-            for catalog_record in catalog_records:
-                if catalog_record.get('name') == catalog_name:
-                    cls._logger.debug('Sharing catalog ' + catalog_name + ' to'
-                                      ' all members of org ' + org.get_name())
-                    org.share_catalog_with_org_members(
-                        catalog_name=catalog_name)
-                    return
-            raise EntityNotFoundException('Catalog ' + catalog_name +
-                                          'doesn\'t exist.')
-        finally:
-            catalog_author_client.logout()
+        catalog_author_client = cls._get_catalog_author_client()
+        org = Org(catalog_author_client, href=cls._org_href)
+        catalog_name = cls._config['vcd']['default_catalog_name']
+        catalog_records = cls._list_catalogs(org)
+        if catalog_name.lower() in _index_by_name(catalog_records):
+            cls._logger.debug('Sharing catalog %s to all members of org %s',
+                              catalog_name, org.get_name())
+            org.share_catalog_with_org_members(catalog_name=catalog_name)
+            return
+        raise EntityNotFoundException('Catalog ' + catalog_name +
+                                      'doesn\'t exist.')
 
     @classmethod
     def upload_template(cls):
@@ -716,33 +1008,31 @@ class Environment(object):
             raise Exception('Org ' + cls._config['vcd']['default_org_name'] +
                             ' doesn\'t exist.')
 
-        try:
-            catalog_author_client = Environment.get_client_in_default_org(
-                CommonRoles.CATALOG_AUTHOR)
-            org = Org(catalog_author_client, href=cls._org_href)
-
-            catalog_name = cls._config['vcd']['default_catalog_name']
-            catalog_items = org.list_catalog_items(catalog_name)
-            template_name = cls._config['vcd']['default_template_file_name']
-            for item in catalog_items:
-                if item.get('name').lower() == template_name.lower():
-                    cls._logger.debug('Reusing existing template ' +
-                                      template_name)
-                    return
-
-            cls._logger.debug('Uploading template ' + template_name +
-                              ' to catalog ' + catalog_name + '.')
-            org.upload_ovf(catalog_name=catalog_name, file_name=template_name)
-
-            # wait for the template import to finish in vCD.
-            catalog_item = org.get_catalog_item(
-                name=catalog_name, item_name=template_name)
-            template = catalog_author_client.get_resource(
-                catalog_item.Entity.get('href'))
-            catalog_author_client.get_task_monitor().wait_for_success(
-                task=template.Tasks.Task[0])
-        finally:
-            catalog_author_client.logout()
+        catalog_author_client = cls._get_catalog_author_client()
+        org = Org(catalog_author_client, href=cls._org_href)
+
+        catalog_name = cls._config['vcd']['default_catalog_name']
+        catalog_items = cls._list_catalog_items(org, catalog_name)
+        template_name = cls._config['vcd']['default_template_file_name']
+        if template_name.lower() in _index_by_name(catalog_items):
+            cls._logger.debug('Reusing existing template %s', template_name)
+            return
+
+        cls._logger.debug('Uploading template %s to catalog %s.',
+                          template_name, catalog_name)
+        org.upload_ovf(catalog_name=catalog_name, file_name=template_name)
+
+        # wait for the template import to finish in vCD.
+        catalog_item = org.get_catalog_item(
+            name=catalog_name, item_name=template_name)
+        template = catalog_author_client.get_resource(
+            catalog_item.Entity.get('href'))
+        catalog_author_client.get_task_monitor().wait_for_success(
+            task=template.Tasks.Task[0])
+        catalog_items.append({
+            'name': template_name,
+            'id': catalog_item.get('id')
+        })
 
     @classmethod
     def upload_media(cls):
@@ -757,55 +1047,101 @@ class Environment(object):
             raise Exception('Org ' + cls._config['vcd']['default_org_name'] +
                             ' doesn\'t exist.')
 
-        try:
-            catalog_author_client = Environment.get_client_in_default_org(
-                CommonRoles.CATALOG_AUTHOR)
-            org = Org(catalog_author_client, href=cls._org_href)
-
-            catalog_name = cls._config['vcd']['default_catalog_name']
-            catalog_items = org.list_catalog_items(catalog_name)
-            media_name = cls._config['vcd']['default_media_name']
-            for item in catalog_items:
-                if item.get('name').lower() == media_name.lower():
-                    cls._logger.debug('Reusing existing media ' + media_name)
-                    cls._media_resource = org.get_catalog_item(
-                        catalog_name, media_name)
-                    return
-
-            cls._logger.debug('Uploading media ' + media_name +
-                              ' to catalog ' + catalog_name + '.')
-            org.upload_media(catalog_name=catalog_name, file_name=media_name)
-
-            # wait for the template import to finish in vCD.
-            catalog_item = org.get_catalog_item(
-                name=catalog_name, item_name=media_name)
-            media = catalog_author_client.get_resource(
-                catalog_item.Entity.get('href'))
-            if hasattr(media, "Tasks"):
-                catalog_author_client.get_task_monitor().wait_for_success(
-                    task=media.Tasks.Task[0])
-
-            cls._media_resource = org.get_catalog_item(catalog_name,
-                                                       media_name)
+        catalog_author_client = cls._get_catalog_author_client()
+        org = Org(catalog_author_client, href=cls._org_href)
+
+        catalog_name = cls._config['vcd']['default_catalog_name']
+        catalog_items = cls._list_catalog_items(org, catalog_name)
+        media_name = cls._config['vcd']['default_media_name']
+        if media_name.lower() in _index_by_name(catalog_items):
+            cls._logger.debug('Reusing existing media %s', media_name)
+            cls._media_resource = org.get_catalog_item(
+                catalog_name, media_name)
+            return
+
+        cls._logger.debug('Uploading media %s to catalog %s.', media_name,
+                          catalog_name)
+        org.upload_media(catalog_name=catalog_name, file_name=media_name)
+
+        # wait for the template import to finish in vCD.
+        catalog_item = org.get_catalog_item(
+            name=catalog_name, item_name=media_name)
+        media = catalog_author_client.get_resource(
+            catalog_item.Entity.get('href'))
+        if hasattr(media, "Tasks"):
+            catalog_author_client.get_task_monitor().wait_for_success(
+                task=media.Tasks.Task[0])
+        catalog_items.append({
+            'name': media_name,
+            'id': catalog_item.get('id')
+        })
 
-        finally:
-            catalog_author_client.logout()
+        cls._media_resource = org.get_catalog_item(catalog_name,
+                                                   media_name)
+
+    @classmethod
+    def setup_fixtures(cls, max_workers=4):
+        """Creates all the fixtures needed by the tests.
+
+        The setup steps are REST bound and mostly independent of each other,
+        so they are run on a thread pool. A step is started as soon as all
+        the steps it depends on have finished.
+
+        :param int max_workers: maximum number of steps to run concurrently.
+
+        :raises: Exception: if any of the setup steps fail. Steps that are
+            already running are allowed to finish, no new steps are started.
+        """
+        # Log in the sys admin client before the steps race to do so.
+        cls._basic_check()
+
+        pending = dict(cls._setup_step_dependencies)
+        finished_steps = set()
+        running = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                for step, dependencies in list(pending.items()):
+                    if finished_steps.issuperset(dependencies):
+                        del pending[step]
+                        future = executor.submit(getattr(cls, step))
+                        running[future] = step
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    future.result()
+                    cls._logger.debug('Finished setup step %s.', step)
+                    finished_steps.add(step)
 
     @classmethod
     def cleanup(cls):
         """Cleans up the various class variables."""
+        if cls._catalog_author_client is not None:
+            cls._catalog_author_client.logout()
+            cls._catalog_author_client = None
         if cls._sys_admin_client is not None:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore", ResourceWarning)  # NOQA
-                cls._sys_admin_client.logout()
-                cls._sys_admin_client = None
-                cls._pvdc_href = None
-                cls._pvdc_name = None
-                cls._external_network_href = None
-                cls._external_network_name = None
-                cls._org_href = None
-                cls._ovdc_href = None
-                cls._vapp_href = None
+            cls._sys_admin_client.logout()
+            cls._sys_admin_client = None
+            cls._system = None
+            cls._platform = None
+            cls._sys_admin_org = None
+            cls._catalog_records_cache = None
+            cls._catalog_items_cache = {}
+            cls._pvdc_href = None
+            cls._pvdc_name = None
+            cls._external_network_href = None
+            cls._external_network_name = None
+            cls._org_href = None
+            cls._ovdc_href = None
+            cls._vapp_href = None
+
+    @classmethod
+    def _close_http_adapter(cls):
+        """Closes the connection pool shared by the test clients."""
+        if cls._http_adapter is not None:
+            cls._http_adapter.close()
+            cls._http_adapter = None
 
     @classmethod
     def get_test_pvdc_name(cls):
@@ -875,8 +1211,7 @@ class Environment(object):
         if not cls._vapp_href:
             vdc = Environment.get_test_vdc(client)
             try:
-                vapp = vdc.get_vapp(VAppConstants.name)
-                cls._vapp_href = vapp.get('href')
+                cls._vapp_href = vdc.get_vapp_href(VAppConstants.name)
             except EntityNotFoundException:
                 cls._vapp_href = create_vapp_from_template(
                     client,
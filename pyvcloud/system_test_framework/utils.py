@@ -13,6 +13,78 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+import functools
+
+from pyvcloud.vcd.vapp import VApp
+
+
+# Task polling bounds (in seconds) used by wait_for_task_success. Starts
+# polling quickly and backs off, so short tasks are not held up for the 5s
+# default poll interval of the task monitor.
+TASK_POLL_FREQUENCY_SEC = 1
+TASK_MAX_POLL_FREQUENCY_SEC = 2
+
+# Upper bound on the number of tasks wait_for_tasks polls at the same time.
+MAX_CONCURRENT_TASK_WAITS = 8
+
+
+def wait_for_task_success(client, task):
+    """Helper method to wait for a task to complete successfully.
+
+    :param pyvcloud.vcd.client.Client client: a client that would be used
+        to make ReST calls to vCD.
+    :param lxml.objectify.ObjectifiedElement task: the task to wait on.
+
+    :return: the task in its final state.
+
+    :rtype: lxml.objectify.ObjectifiedElement
+    """
+    return client.get_task_monitor().wait_for_success(
+        task=task,
+        poll_frequency=TASK_POLL_FREQUENCY_SEC,
+        max_poll_frequency=TASK_MAX_POLL_FREQUENCY_SEC)
+
+
+def wait_for_success_status(client, task):
+    """Helper method to wait for a task and get its final status.
+
+    :param pyvcloud.vcd.client.Client client: a client that would be used
+        to make ReST calls to vCD.
+    :param lxml.objectify.ObjectifiedElement task: the task to wait on.
+
+    :return: the status of the task once it is done, one of the values in
+        pyvcloud.vcd.client.TaskStatus.
+
+    :rtype: str
+    """
+    return wait_for_task_success(client, task).get('status')
+
+
+def wait_for_tasks(client, tasks):
+    """Helper method to wait for several tasks to complete successfully.
+
+    Up to MAX_CONCURRENT_TASK_WAITS tasks are waited on concurrently, so the
+    overall wait is close to the slowest task rather than the sum of all of
+    them.
+
+    :param pyvcloud.vcd.client.Client client: a client that would be used
+        to make ReST calls to vCD, it should be able to read all the tasks.
+    :param list tasks: list of lxml.objectify.ObjectifiedElement, the tasks
+        to wait on.
+
+    :return: the tasks in their final state, in the same order as tasks.
+
+    :rtype: list
+    """
+    if len(tasks) == 0:
+        return []
+    max_workers = min(MAX_CONCURRENT_TASK_WAITS, len(tasks))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                functools.partial(wait_for_task_success, client), tasks))
+
 
 def create_empty_vapp(client, vdc, name, description):
     """Helper method to create an empty vApp.
@@ -31,8 +103,7 @@ def create_empty_vapp(client, vdc, name, description):
     vapp_sparse_resouce = vdc.create_vapp(
         name=name, description=description, accept_all_eulas=True)
 
-    client.get_task_monitor().wait_for_success(
-        vapp_sparse_resouce.Tasks.Task[0])
+    wait_for_task_success(client, vapp_sparse_resouce.Tasks.Task[0])
 
     return vapp_sparse_resouce.get('href')
 
@@ -66,12 +137,62 @@ def create_vapp_from_template(client,
         power_on=power_on,
         deploy=deploy)
 
-    client.get_task_monitor().wait_for_success(
-        vapp_sparse_resouce.Tasks.Task[0])
+    wait_for_task_success(client, vapp_sparse_resouce.Tasks.Task[0])
 
     return vapp_sparse_resouce.get('href')
 
 
+def instantiate_customized_vapp_from_template(vdc,
+                                              name,
+                                              catalog_name,
+                                              template_name,
+                                              description=None,
+                                              memory_size=None,
+                                              num_cpu=None,
+                                              disk_size=None,
+                                              vm_name=None,
+                                              vm_hostname=None,
+                                              nw_adapter_type=None):
+    """Helper method to start creating a customized vApp from template.
+
+    Doesn't wait for the instantiation task, so that callers can wait on it
+    along with other tasks.
+
+    :param pyvcloud.vcd.vdc.VDC vdc: the vdc in which the vApp will be
+        created.
+    :param str name: name of the new vApp.
+    :param str catalog_name: name of the catalog.
+    :param str template_name: name of the vApp template.
+    :param str description: description of the new vApp.
+    :param int memory_size: size of memory of the first vm.
+    :param int num_cpu: number of cpus in the first vm.
+    :param int disk_size: size of the first disk of the first vm.
+    :param str vm_name: when provided, sets the name of the vm.
+    :param str vm_hostname: when provided, sets the hostname of the guest OS.
+    :param str nw_adapter_type: One of the values in
+            pyvcloud.vcd.client.NetworkAdapterType.
+
+    :return: an object containing EntityType.VAPP XML data representing the
+        sparse vApp being created, including the instantiation task.
+
+    :rtype: lxml.objectify.ObjectifiedElement
+    """
+    return vdc.instantiate_vapp(
+        name=name,
+        catalog=catalog_name,
+        template=template_name,
+        description=description,
+        deploy=True,
+        power_on=True,
+        accept_all_eulas=True,
+        memory=memory_size,
+        cpu=num_cpu,
+        disk_size=disk_size,
+        vm_name=vm_name,
+        hostname=vm_hostname,
+        network_adapter_type=nw_adapter_type)
+
+
 def create_customized_vapp_from_template(client,
                                          vdc,
                                          name,
@@ -83,9 +204,14 @@ def create_customized_vapp_from_template(client,
                                          disk_size=None,
                                          vm_name=None,
                                          vm_hostname=None,
-                                         nw_adapter_type=None):
+                                         nw_adapter_type=None,
+                                         vms=None):
     """Helper method to create a customized vApp from template.
 
+    The first vm is instantiated from the template and customized. Any
+    further vms are clones of the first one, and are all added to the vApp
+    by a single recompose request.
+
     :param pyvcloud.vcd.client.Client client: a client that would be used
         to make ReST calls to vCD.
     :param pyvcloud.vcd.vdc.VDC vdc: the vdc in which the vApp will be
@@ -101,28 +227,73 @@ def create_customized_vapp_from_template(client,
     :param str vm_hostname: when provided, sets the hostname of the guest OS.
     :param str nw_adapter_type: One of the values in
             pyvcloud.vcd.client.NetworkAdapterType.
+    :param list vms: when provided, replaces the vm parameters above. Each
+        entry is a dict describing one vm, with the keys memory_size,
+        num_cpu, disk_size, vm_name, vm_hostname and nw_adapter_type. All of
+        them are optional for the first entry. Further entries must set
+        vm_name and may only set vm_hostname, since they are cloned from the
+        first vm.
 
     :return: href of the created vApp.
 
     :rtype: str
+
+    :raises: Exception: if vms is provided along with any of the single vm
+        parameters, or if an entry after the first one sets anything other
+        than vm_name and vm_hostname.
     """
-    vapp_sparse_resouce = vdc.instantiate_vapp(
+    if vms is None:
+        vms = [{
+            'memory_size': memory_size,
+            'num_cpu': num_cpu,
+            'disk_size': disk_size,
+            'vm_name': vm_name,
+            'vm_hostname': vm_hostname,
+            'nw_adapter_type': nw_adapter_type
+        }]
+    elif any(param is not None
+             for param in (memory_size, num_cpu, disk_size, vm_name,
+                           vm_hostname, nw_adapter_type)):
+        raise Exception('vms replaces the single vm parameters, they can\'t '
+                        'be used together.')
+    first_vm, additional_vms = vms[0], vms[1:]
+    for vm in additional_vms:
+        if 'vm_name' not in vm or not set(vm) <= {'vm_name', 'vm_hostname'}:
+            raise Exception('Additional vms are cloned from the first vm, '
+                            'they need a vm_name and may only set '
+                            'vm_hostname.')
+
+    vapp_sparse_resouce = instantiate_customized_vapp_from_template(
+        vdc=vdc,
         name=name,
-        catalog=catalog_name,
-        template=template_name,
+        catalog_name=catalog_name,
+        template_name=template_name,
         description=description,
-        deploy=True,
-        power_on=True,
-        accept_all_eulas=True,
-        memory=memory_size,
-        cpu=num_cpu,
-        disk_size=disk_size,
-        vm_name=vm_name,
-        hostname=vm_hostname,
-        network_adapter_type=nw_adapter_type)
+        memory_size=first_vm.get('memory_size'),
+        num_cpu=first_vm.get('num_cpu'),
+        disk_size=first_vm.get('disk_size'),
+        vm_name=first_vm.get('vm_name'),
+        vm_hostname=first_vm.get('vm_hostname'),
+        nw_adapter_type=first_vm.get('nw_adapter_type'))
+
+    wait_for_task_success(client, vapp_sparse_resouce.Tasks.Task[0])
 
-    client.get_task_monitor().wait_for_success(
-        vapp_sparse_resouce.Tasks.Task[0])
+    if len(additional_vms) > 0:
+        vapp = VApp(client, href=vapp_sparse_resouce.get('href'))
+        vapp_resource = vapp.get_resource()
+        source_vm_name = vapp.get_all_vms()[0].get('name')
+        specs = []
+        for vm in additional_vms:
+            spec = {
+                'vapp': vapp_resource,
+                'source_vm_name': source_vm_name,
+                'target_vm_name': vm['vm_name']
+            }
+            if vm.get('vm_hostname') is not None:
+                spec['hostname'] = vm['vm_hostname']
+            specs.append(spec)
+        task = vapp.add_vms(specs, all_eulas_accepted=True)
+        wait_for_task_success(client, task)
 
     return vapp_sparse_resouce.get('href')
 
@@ -144,6 +315,6 @@ def create_independent_disk(client, vdc, name, size, description):
     """
     disk_sparse = vdc.create_disk(
         name=name, size=size, description=description)
-    client.get_task_monitor().wait_for_success(disk_sparse.Tasks.Task[0])
+    wait_for_task_success(client, disk_sparse.Tasks.Task[0])
     # clip 'urn:vcloud:disk:' from the id returned by vCD.
     return disk_sparse.get('id')[16:]
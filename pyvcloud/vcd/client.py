@@ -20,6 +20,7 @@ import json
 import logging
 import logging.handlers as handlers
 from pathlib import Path
+import random
 import sys
 import time
 import urllib
@@ -618,12 +619,14 @@ class _TaskMonitor(object):
                          task,
                          timeout=_DEFAULT_TIMEOUT_SEC,
                          poll_frequency=_DEFAULT_POLL_SEC,
-                         callback=None):
+                         callback=None,
+                         max_poll_frequency=None):
         return self.wait_for_status(
             task,
             timeout,
             poll_frequency, [TaskStatus.ERROR], [TaskStatus.SUCCESS],
-            callback=callback)
+            callback=callback,
+            max_poll_frequency=max_poll_frequency)
 
     def wait_for_status(self,
                         task,
@@ -634,7 +637,8 @@ class _TaskMonitor(object):
                             TaskStatus.ERROR
                         ],
                         expected_target_statuses=[TaskStatus.SUCCESS],
-                        callback=None):
+                        callback=None,
+                        max_poll_frequency=None):
         """Waits for task to reach expected status.
 
         :param Task task: Task returned by post or put calls.
@@ -648,6 +652,10 @@ class _TaskMonitor(object):
             TimeOutException.
         :param list expected_target_statuses: list of expected target
             status.
+        :param float max_poll_frequency: if not None, the time between two
+            polls starts at poll_frequency and doubles after every poll up to
+            this value. Each wait is randomized between poll_frequency and the
+            current value, so that concurrent waiters don't poll in lockstep.
         :return: Task we were waiting for
         :rtype Task:
         :raises TimeoutException: If task is not finished within given time.
@@ -661,6 +669,7 @@ class _TaskMonitor(object):
             _fail_on_statuses = fail_on_statuses
         task_href = task.get('href')
         start_time = datetime.now()
+        poll_interval = poll_frequency
         while True:
             task = self._get_task_status(task_href)
             if callback is not None:
@@ -674,7 +683,11 @@ class _TaskMonitor(object):
                     raise VcdTaskException(task_status, task.Error)
             if start_time - datetime.now() > timedelta(seconds=timeout):
                 break
-            time.sleep(poll_frequency)
+            if max_poll_frequency is None:
+                time.sleep(poll_frequency)
+            else:
+                time.sleep(random.uniform(poll_frequency, poll_interval))
+                poll_interval = min(poll_interval * 2, max_poll_frequency)
         raise TaskTimeoutException("Task timeout")
 
     def _get_task_status(self, task_href):
@@ -750,6 +763,10 @@ class Client(object):
     :param boolean log_request: if True log HTTP requests.
     :param boolean log_headers: if True log HTTP headers.
     :param boolean log_bodies: if True log HTTP bodies.
+    :param requests.adapters.HTTPAdapter http_adapter: if not None, the
+        adapter is mounted on every HTTP session opened by the client, which
+        allows several clients to share one connection pool. The adapter is
+        owned by the caller and is not closed when the client logs out.
     """
 
     _HEADER_ACCEPT_NAME = 'Accept'
@@ -794,7 +811,8 @@ class Client(object):
                  log_file=None,
                  log_requests=False,
                  log_headers=False,
-                 log_bodies=False):
+                 log_bodies=False,
+                 http_adapter=None):
         self._logger = None
         self._get_default_logger(file_name=log_file)
 
@@ -802,6 +820,7 @@ class Client(object):
         self._log_headers = log_headers
         self._log_bodies = log_bodies
         self._verify_ssl_certs = verify_ssl_certs
+        self._http_adapter = http_adapter
 
         self.fsencoding = sys.getfilesystemencoding()
 
@@ -866,6 +885,33 @@ class Client(object):
             log_handler.setLevel(log_level)
             self._logger.addHandler(log_handler)
 
+    def _new_session(self):
+        """Open a new HTTP session, mounting the shared adapter if any.
+
+        :return: a new session.
+
+        :rtype: requests.Session
+        """
+        session = requests.Session()
+        if self._http_adapter is not None:
+            session.mount('https://', self._http_adapter)
+            session.mount('http://', self._http_adapter)
+        return session
+
+    def _close_session(self, session):
+        """Close a session opened by _new_session().
+
+        The shared adapter is unmounted first, so that closing the session
+        doesn't drop the pooled connections other clients are using.
+
+        :param requests.Session session: session to close.
+        """
+        if self._http_adapter is not None:
+            for prefix in ('https://', 'http://'):
+                if session.adapters.get(prefix) is self._http_adapter:
+                    del session.adapters[prefix]
+        session.close()
+
     def _negotiate_api_version(self):
         """Negotiate the API version to use with VCD.
 
@@ -936,8 +982,8 @@ class Client(object):
 
         :rtype: list
         """
-        with requests.Session() as new_session:
-            # Use with block to avoid leaking socket connections.
+        new_session = self._new_session()
+        try:
             response = self._do_request_prim(
                 'GET',
                 self._api_base_uri + '/versions',
@@ -969,6 +1015,9 @@ class Client(object):
                         active_versions.append(alpha_version)
             active_versions.sort(key=VCDApiVersion)
             return active_versions
+        finally:
+            # Always close the session to avoid leaking socket connections.
+            self._close_session(new_session)
 
     def get_supported_versions(self, include_alpha_versions: bool = False):
         """Return non-deprecated server API version Objects as a list.
@@ -1024,7 +1073,7 @@ class Client(object):
 
         # Ensure we close session if any exception is thrown to avoid leaking
         # a socket connection.
-        new_session = requests.Session()
+        new_session = self._new_session()
         try:
             # Use /cloudapi/1.0.0/sessions for Xendi and beyond i.e. api v33+
             # otherwise use /api/sessions
@@ -1067,7 +1116,7 @@ class Client(object):
                 access_token = response.headers[self._HEADER_X_VMWARE_CLOUD_ACCESS_TOKEN_NAME]  # noqa: E501
                 # A new session will be created in rehydrate and stored in
                 # this object
-                new_session.close()
+                self._close_session(new_session)
                 self.rehydrate_from_token(
                     token=access_token, is_jwt_token=True)
             else:
@@ -1082,7 +1131,7 @@ class Client(object):
                     _get_session_endpoints(self._vcloud_session)
 
         except Exception:
-            new_session.close()
+            self._close_session(new_session)
             raise
 
     def rehydrate_from_token(self, token, is_jwt_token=False):
@@ -1104,7 +1153,7 @@ class Client(object):
         self._negotiate_api_version()
         self._logger.debug('API version in use: %s' % self._api_version)
 
-        new_session = requests.Session()
+        new_session = self._new_session()
         try:
             if is_jwt_token:
                 self._vcloud_access_token = token
@@ -1131,7 +1180,7 @@ class Client(object):
                 _get_session_endpoints(self._vcloud_session)
 
         except Exception:
-            new_session.close()
+            self._close_session(new_session)
             raise
 
         return self._vcloud_session
@@ -1145,7 +1194,7 @@ class Client(object):
         if self._session:
             uri = self._api_base_uri + '/session'
             result = self._do_request('DELETE', uri)
-            self._session.close()
+            self._close_session(self._session)
             self._session = None
             self._vcloud_session = None
             self._vcloud_access_token = None
@@ -1659,8 +1708,9 @@ class Client(object):
         # exactly 1 organization.
         orgs = self._get_wk_resource(_WellKnownEndpoint.ORG_LIST)
         if hasattr(orgs, 'Org'):
+            org_name_lower = org_name.lower()
             for org in orgs.Org:
-                if org.get('name').lower() == org_name.lower():
+                if org.get('name').lower() == org_name_lower:
                     return self.get_resource(org.get('href'))
         raise EntityNotFoundException('org \'%s\' not found' % org_name)
 
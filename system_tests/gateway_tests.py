@@ -13,7 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import unittest
-from uuid import uuid1
+from uuid import uuid4
 from pyvcloud.vcd.client import ApiVersion
 from pyvcloud.vcd.client import E
 from pyvcloud.vcd.client import EntityType
@@ -28,6 +28,8 @@ from pyvcloud.vcd.extension import Extension
 from pyvcloud.system_test_framework.base_test import BaseTestCase
 from pyvcloud.system_test_framework.environment import CommonRoles
 from pyvcloud.system_test_framework.environment import Environment
+from pyvcloud.system_test_framework.utils import wait_for_success_status
+from pyvcloud.system_test_framework.utils import wait_for_task_success
 from pyvcloud.system_test_framework.constants.gateway_constants import \
     GatewayConstants
 from pyvcloud.vcd.gateway import Gateway
@@ -39,8 +41,9 @@ class TestGateway(BaseTestCase):
     """Test Gateway functionalities implemented in pyvcloud."""
     # All tests in this module should be run as System Administrator.
     _client = None
-    _name = (GatewayConstants.name + str(uuid1()))[:34]
-    _description = GatewayConstants.description + str(uuid1())
+    _org_client = None
+    _name = None
+    _description = None
     _gateway = None
     _rate_limit_start = '101.0'
     _rate_limit_end = '101.0'
@@ -59,6 +62,48 @@ class TestGateway(BaseTestCase):
     _ip_address_for_config_ip_setting = '2.2.3.3'
     _ip_address_for_ip_range = '2.2.3.4-2.2.3.4'
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        suffix = uuid4().hex[:8]
+        cls._name = GatewayConstants.name + suffix
+        cls._description = GatewayConstants.description + suffix
+        cls._logger = Environment.get_default_logger()
+        cls._client = Environment.get_sys_admin_client()
+        cls._vdc = Environment.get_test_vdc(cls._client)
+        cls._prepare_gateway_params()
+
+    @classmethod
+    def _prepare_gateway_params(cls):
+        """Computes the gateway creation parameters once for the class.
+
+        Fetches the test external network and stores its name, gateway ip
+        and subnet, along with the ip settings, ip range and rate limit
+        dictionaries expected by VDC.create_gateway_api_version_xx().
+        """
+        external_network = Environment.get_test_external_network(cls._client)
+        ext_net_resource = external_network.get_resource()
+        ip_scopes = ext_net_resource.xpath(
+            'vcloud:Configuration/vcloud:IpScopes/vcloud:IpScope',
+            namespaces=NSMAP)
+        first_ipscope = ip_scopes[0]
+        cls._ext_net_name = ext_net_resource.get('name')
+        cls._gateway_ip = first_ipscope.Gateway.text
+        prefix_len = netmask_to_cidr_prefix_len(cls._gateway_ip,
+                                                first_ipscope.Netmask.text)
+        cls._subnet_addr = cls._gateway_ip + '/' + str(prefix_len)
+        cls._ip_settings_dict = {
+            cls._ext_net_name: {
+                cls._subnet_addr: cls._ip_address_for_config_ip_setting
+            }
+        }
+        cls._ip_range_dict = {
+            cls._ext_net_name: {
+                cls._subnet_addr: [cls._ip_address_for_ip_range]
+            }
+        }
+        cls._rate_limit_dict = {cls._ext_net_name: {100: 100}}
+
     def test_0000_setup(self):
         """Setup the gateway required for the other tests in this module.
 
@@ -67,71 +112,30 @@ class TestGateway(BaseTestCase):
 
         This test passes if the gateway is created successfully.
         """
-        TestGateway._client = Environment.get_sys_admin_client()
-        TestGateway._vdc = Environment.get_test_vdc(TestGateway._client)
-
         TestGateway._org_client = Environment.get_client_in_default_org(
             CommonRoles.ORGANIZATION_ADMINISTRATOR)
         TestGateway._config = Environment.get_config()
         TestGateway._api_version = TestGateway._config['vcd']['api_version']
 
-        external_network = Environment.get_test_external_network(
-            TestGateway._client)
-
-        ext_net_resource = external_network.get_resource()
-        ip_scopes = ext_net_resource.xpath(
-            'vcloud:Configuration/vcloud:IpScopes/vcloud:IpScope',
-            namespaces=NSMAP)
-        first_ipscope = ip_scopes[0]
-        gateway_ip = first_ipscope.Gateway.text
-        prefix_len = netmask_to_cidr_prefix_len(gateway_ip,
-                                                first_ipscope.Netmask.text)
-        subnet_addr = gateway_ip + '/' + str(prefix_len)
-        ext_net_to_participated_subnet_with_ip_settings = {
-            ext_net_resource.get('name'): {
-                subnet_addr: self._ip_address_for_config_ip_setting
-            }
-        }
-
-        ext_net_to_subnet_with_ip_range = {
-            ext_net_resource.get('name'): {
-                subnet_addr: [self._ip_address_for_ip_range]
-            }
-        }
-        ext_net_to_rate_limit = {ext_net_resource.get('name'): {100: 100}}
         if float(TestGateway._api_version) <= float(
                 ApiVersion.VERSION_30.value):
-            TestGateway._gateway = \
-                TestGateway._vdc.create_gateway_api_version_30(
-                    self._name, [ext_net_resource.get('name')], 'compact',
-                    None,
-                    True, ext_net_resource.get('name'), gateway_ip, True,
-                    False,
-                    False, False, True,
-                    ext_net_to_participated_subnet_with_ip_settings, True,
-                    ext_net_to_subnet_with_ip_range, ext_net_to_rate_limit)
+            create_gateway = TestGateway._vdc.create_gateway_api_version_30
         elif float(TestGateway._api_version) == float(
                 ApiVersion.VERSION_31.value):
-            TestGateway._gateway = \
-                TestGateway._vdc.create_gateway_api_version_31(
-                    self._name, [ext_net_resource.get('name')], 'compact',
-                    None, True, ext_net_resource.get('name'), gateway_ip,
-                    True, False, False, False, True,
-                    ext_net_to_participated_subnet_with_ip_settings, True,
-                    ext_net_to_subnet_with_ip_range, ext_net_to_rate_limit)
+            create_gateway = TestGateway._vdc.create_gateway_api_version_31
         elif float(TestGateway._api_version) >= float(
                 ApiVersion.VERSION_32.value):
-            TestGateway._gateway = \
-                TestGateway._vdc.create_gateway_api_version_32(
-                    self._name, [ext_net_resource.get('name')], 'compact',
-                    None, True, ext_net_resource.get('name'), gateway_ip,
-                    True, False, False, False, True,
-                    ext_net_to_participated_subnet_with_ip_settings, True,
-                    ext_net_to_subnet_with_ip_range, ext_net_to_rate_limit)
-
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=TestGateway._gateway.Tasks.Task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+            create_gateway = TestGateway._vdc.create_gateway_api_version_32
+        TestGateway._gateway = create_gateway(
+            self._name, [TestGateway._ext_net_name], 'compact', None, True,
+            TestGateway._ext_net_name, TestGateway._gateway_ip, True, False,
+            False, False, True, TestGateway._ip_settings_dict, True,
+            TestGateway._ip_range_dict, TestGateway._rate_limit_dict)
+
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client,
+                                    TestGateway._gateway.Tasks.Task),
+            TaskStatus.SUCCESS.value)
 
         TestGateway._extension = Extension(TestGateway._client)
         TestGateway._extension.get_resource()
@@ -164,9 +168,9 @@ class TestGateway(BaseTestCase):
         gateway_obj = Gateway(TestGateway._org_client, self._name,
                               TestGateway._gateway.get('href'))
         task = gateway_obj.convert_to_advanced()
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
 
     def test_0002_enable_dr(self):
         """Enable the Distributed routing.
@@ -176,9 +180,9 @@ class TestGateway(BaseTestCase):
         gateway_obj = Gateway(TestGateway._client, self._name,
                               TestGateway._gateway.get('href'))
         task = gateway_obj.enable_distributed_routing(True)
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
 
     def test_0003_modify_form_factor(self):
         """Modify form factor.
@@ -189,9 +193,9 @@ class TestGateway(BaseTestCase):
                               TestGateway._gateway.get('href'))
         task = gateway_obj.modify_form_factor(
             GatewayBackingConfigType.FULL.value)
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
 
     def test_0004_list_external_network_ip_allocations(self):
         """List external network ip allocations.
@@ -213,9 +217,9 @@ class TestGateway(BaseTestCase):
             gateway_obj = Gateway(client, self._name,
                                   TestGateway._gateway.get('href'))
             task = gateway_obj.redeploy()
-            result = TestGateway._client.get_task_monitor().wait_for_success(
-                task=task)
-            self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+            self.assertEqual(
+                wait_for_success_status(TestGateway._client, task),
+                TaskStatus.SUCCESS.value)
 
     def test_0006_sync_syslog_settings(self):
         """Sync syslog settings of the gateway.
@@ -226,9 +230,9 @@ class TestGateway(BaseTestCase):
             gateway_obj = Gateway(client, self._name,
                                   TestGateway._gateway.get('href'))
             task = gateway_obj.sync_syslog_settings()
-            result = TestGateway._client.get_task_monitor().wait_for_success(
-                task=task)
-            self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+            self.assertEqual(
+                wait_for_success_status(TestGateway._client, task),
+                TaskStatus.SUCCESS.value)
 
     def test_0010_set_tenant_syslog_server_ip(self):
         """Set Tenant syslog server IP of the gateway.
@@ -239,9 +243,9 @@ class TestGateway(BaseTestCase):
         gateway_obj = Gateway(TestGateway._client, self._name,
                               TestGateway._gateway.get('href'))
         task = gateway_obj.set_tenant_syslog_server_ip('192.168.5.6')
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
 
     def test_0015_list_external_network_config_ip_allocations(self):
         """List external network configure ip allocations.
@@ -252,11 +256,9 @@ class TestGateway(BaseTestCase):
             gateway_obj = Gateway(client, self._name,
                                   TestGateway._gateway.get('href'))
             ip_allocations = gateway_obj.list_configure_ip_settings()
-            platform = Platform(TestGateway._client)
-            external_networks = platform.list_external_networks()
             self.assertTrue(bool(ip_allocations))
             exnet = ip_allocations[0].get('external_network')
-            self.assertEqual(external_networks[0].get('name'), exnet)
+            self.assertEqual(TestGateway._ext_net_name, exnet)
 
     def _create_external_network(self):
         """Creates an external network from the available portgroup."""
@@ -278,7 +280,7 @@ class TestGateway(BaseTestCase):
             raise Exception(
                 'None of the port groups are free for new network.')
 
-        name = 'external_network_' + str(uuid1())
+        name = 'external_network_' + uuid4().hex[:8]
         platform = Platform(TestGateway._client)
         ext_net = platform.create_external_network(
             name=name,
@@ -293,16 +295,16 @@ class TestGateway(BaseTestCase):
             dns_suffix='example.com')
 
         task = ext_net['{' + NSMAP['vcloud'] + '}Tasks'].Task[0]
-        TestGateway._client.get_task_monitor().wait_for_success(task=task)
+        wait_for_task_success(TestGateway._client, task)
         TestGateway._external_network2 = ext_net
         return ext_net
 
     def _delete_external_network(self, network):
-        logger = Environment.get_default_logger()
         platform = Platform(TestGateway._client)
         task = platform.delete_external_network(network.get('name'))
-        TestGateway._client.get_task_monitor().wait_for_success(task=task)
-        logger.debug('Deleted external network ' + network.get('name') + '.')
+        wait_for_task_success(TestGateway._client, task)
+        TestGateway._logger.debug('Deleted external network ' +
+                                  network.get('name') + '.')
 
     def test_0020_add_external_network(self):
         """Add an exernal netowrk to the gateway.
@@ -324,9 +326,9 @@ class TestGateway(BaseTestCase):
 
         task = gateway_obj.add_external_network(
             extNw2.get('name'), [(subnet_addr, 'Auto')])
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
 
     def test_0025_remove_external_network(self):
         """Remove an exernal netowrk from the gateway.
@@ -337,9 +339,9 @@ class TestGateway(BaseTestCase):
                               TestGateway._gateway.get('href'))
         task = gateway_obj.remove_external_network(
             TestGateway._external_network2.get('name'))
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
 
         self._delete_external_network(TestGateway._external_network2)
 
@@ -351,14 +353,14 @@ class TestGateway(BaseTestCase):
         gateway_obj = Gateway(TestGateway._client, self._name,
                               TestGateway._gateway.get('href'))
         task = gateway_obj.edit_gateway(newname='gateway2')
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
         '''resetting back to original gateway name'''
         task = gateway_obj.edit_gateway(TestGateway._name)
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
 
     def test_0035_edit_config_ipaddress(self):
         """It edits the config ip settings of gateway.
@@ -380,9 +382,9 @@ class TestGateway(BaseTestCase):
 
         ipconfig[ip_allocation.get('external_network')] = subnet
         task = gateway_obj.edit_config_ip_settings(ipconfig)
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
 
     def __get_subnet_participation(self, gateway, ext_network):
         for gatewayinf in \
@@ -416,9 +418,9 @@ class TestGateway(BaseTestCase):
 
         task = gateway_obj.add_sub_allocated_ip_pools(ext_network,
                                                       ip_range_list)
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
         gateway_obj = Gateway(TestGateway._client, self._name,
                               TestGateway._gateway.get('href'))
         subnet_participation = self.__get_subnet_participation(
@@ -447,9 +449,9 @@ class TestGateway(BaseTestCase):
         task = gateway_obj.edit_sub_allocated_ip_pools(
             ext_network, gateway_sub_allocated_ip_range,
             gateway_sub_allocated_ip_range1)
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
         gateway_obj = Gateway(TestGateway._client, self._name,
                               TestGateway._gateway.get('href'))
         subnet_participation = self.__get_subnet_participation(
@@ -474,9 +476,9 @@ class TestGateway(BaseTestCase):
 
         task = gateway_obj.remove_sub_allocated_ip_pools(
             ext_network, [gateway_sub_allocated_ip_range1])
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
         gateway_obj = Gateway(TestGateway._client, self._name,
                               TestGateway._gateway.get('href'))
         subnet_participation = self.__get_subnet_participation(
@@ -506,9 +508,9 @@ class TestGateway(BaseTestCase):
         config[ext_network] = [self._rate_limit_start, self._rate_limit_end]
 
         task = gateway_obj.edit_rate_limits(config)
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
         gateway_obj = Gateway(TestGateway._client, self._name,
                               TestGateway._gateway.get('href'))
         for gateway_inf in \
@@ -561,9 +563,9 @@ class TestGateway(BaseTestCase):
         gateway_obj = Gateway(TestGateway._client, self._name,
                               TestGateway._gateway.get('href'))
         task = gateway_obj.disable_rate_limits([ext_network])
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
         # verification
         gateway_obj = Gateway(TestGateway._client, self._name,
                               TestGateway._gateway.get('href'))
@@ -588,9 +590,9 @@ class TestGateway(BaseTestCase):
                               TestGateway._gateway.get('href'))
         task = gateway_obj.configure_default_gateway(ext_network,
                                                      gateway_ip[0], 'true')
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
         # verification
         gateway_obj = Gateway(TestGateway._client, self._name,
                               TestGateway._gateway.get('href'))
@@ -606,18 +608,18 @@ class TestGateway(BaseTestCase):
         gateway_obj = Gateway(TestGateway._client, self._name,
                               TestGateway._gateway.get('href'))
         task = gateway_obj.configure_dns_default_gateway('true')
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
         # verification
         gateway_obj = Gateway(TestGateway._client, self._name,
                               TestGateway._gateway.get('href'))
         self.assertTrue(gateway_obj.get_resource()
                         .Configuration.UseDefaultRouteForDnsRelay)
         task = gateway_obj.configure_dns_default_gateway('false')
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
 
     def test_0085_list_configure_default_gateway(self):
         """list configured default gateway.
@@ -645,9 +647,9 @@ class TestGateway(BaseTestCase):
                               TestGateway._gateway.get('href'))
         task = gateway_obj.configure_default_gateway(ext_network,
                                                      gateway_ip[0], 'false')
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
         # verification
         gateway_obj = Gateway(TestGateway._client, self._name,
                               TestGateway._gateway.get('href'))
@@ -677,7 +679,7 @@ class TestGateway(BaseTestCase):
 
         gateway_obj = Gateway(
             TestGateway._client, self._name,
-            Environment.get_test_gateway(Environment.get_sys_admin_client())
+            Environment.get_test_gateway(TestGateway._client)
             .get('href'))
         gateway_obj.add_dhcp_pool(TestGateway._pool_ip_range)
         dhcp_resource = gateway_obj.get_dhcp()
@@ -696,7 +698,7 @@ class TestGateway(BaseTestCase):
         """
         gateway_obj = Gateway(
             TestGateway._client, self._name,
-            Environment.get_test_gateway(Environment.get_sys_admin_client())
+            Environment.get_test_gateway(TestGateway._client)
             .get('href'))
         gateway_obj.add_dhcp_binding(TestGateway._mac_address,
                                      TestGateway._host_name,
@@ -717,15 +719,17 @@ class TestGateway(BaseTestCase):
 
         This test passes if no errors are generated while deleting the gateway.
         """
-        vdc = Environment.get_test_vdc(TestGateway._client)
-        task = vdc.delete_gateway(TestGateway._name)
-        result = TestGateway._client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+        task = TestGateway._vdc.delete_gateway(TestGateway._name)
+        self.assertEqual(
+            wait_for_success_status(TestGateway._client, task),
+            TaskStatus.SUCCESS.value)
 
     def test_1010_cleanup(self):
         """Release all resources held by this object for testing purposes."""
-        TestGateway._client.logout()
+        if TestGateway._client is not None:
+            TestGateway._client.logout()
+        if TestGateway._org_client is not None:
+            TestGateway._org_client.logout()
 
 
 if __name__ == '__main__':
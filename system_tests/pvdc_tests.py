@@ -14,14 +14,17 @@
 # limitations under the License.
 
 import unittest
-from uuid import uuid1
+from uuid import uuid4
 
 from pyvcloud.system_test_framework.base_test import BaseTestCase
 from pyvcloud.system_test_framework.environment import CommonRoles
 from pyvcloud.system_test_framework.environment import developerModeAware
 from pyvcloud.system_test_framework.environment import Environment
 from pyvcloud.system_test_framework.utils import \
-    create_customized_vapp_from_template
+    instantiate_customized_vapp_from_template
+from pyvcloud.system_test_framework.utils import wait_for_success_status
+from pyvcloud.system_test_framework.utils import wait_for_task_success
+from pyvcloud.system_test_framework.utils import wait_for_tasks
 
 from pyvcloud.vcd.client import EntityType
 from pyvcloud.vcd.client import NetworkAdapterType
@@ -35,6 +38,7 @@ from pyvcloud.vcd.exceptions import OperationNotSupportedException
 from pyvcloud.vcd.platform import Platform
 from pyvcloud.vcd.pvdc import PVDC
 from pyvcloud.vcd.utils import get_admin_extension_href
+from pyvcloud.vcd.utils import get_non_admin_href
 from pyvcloud.vcd.vapp import VApp
 from pyvcloud.vcd.vdc import VDC
 
@@ -46,16 +50,14 @@ class TestPVDC(BaseTestCase):
     _org_client = None
     _sys_admin_client = None
 
-    _new_vdc_name = 'org_vdc_' + str(uuid1())
+    _new_vdc_name = None
     _new_vdc_href = None
-    _non_existent_vdc_name = 'non_existent_org_vdc_' + str(uuid1())
-
-    _non_existent_storage_profile_name = \
-        'non_existent_storage_profile_' + str(uuid1())
+    _non_existent_vdc_name = None
+    _non_existent_storage_profile_name = None
 
     _test_runner_role = CommonRoles.VAPP_AUTHOR
 
-    _test_vapp_name = 'test_vApp_' + str(uuid1())
+    _test_vapp_name = None
     _test_vapp_first_vm_num_cpu = 2
     _test_vapp_first_vm_new_num_cpu = 4
     _test_vapp_first_vm_memory_size = 64  # MB
@@ -66,30 +68,99 @@ class TestPVDC(BaseTestCase):
     _test_vapp_href = None
     _test_vapp_first_vm_href = None
 
-    _non_existent_vm_name = 'non_existent_vm_' + str(uuid1())
+    _non_existent_vm_name = None
 
-    def test_0000_setup(self):
-        """Setup the org vdc required for the other tests in this module.
+    _pvdc_name = None
+    _resource_pool_names = None
 
-        Create one org vdc as per the configuration stated above. Test the
-        method Org.create_org_vdc().
+    # Setup tasks that were started but not seen to complete.
+    _setup_tasks = None
+    # Failures collected by _delete_fixtures(), raised by tearDownClass().
+    _teardown_errors = None
 
-        This test passes if the vdc href is not None.
-        """
-        logger = Environment.get_default_logger()
-        TestPVDC._sys_admin_client = Environment.get_sys_admin_client()
-        org = Environment.get_test_org(TestPVDC._sys_admin_client)
-        platform = Platform(TestPVDC._sys_admin_client)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        suffix = uuid4().hex[:8]
+        cls._new_vdc_name = 'org_vdc_' + suffix
+        cls._non_existent_vdc_name = 'non_existent_org_vdc_' + suffix
+        cls._non_existent_storage_profile_name = \
+            'non_existent_storage_profile_' + suffix
+        cls._test_vapp_name = 'test_vApp_' + suffix
+        cls._non_existent_vm_name = 'non_existent_vm_' + suffix
 
-        vdc_name = TestPVDC._new_vdc_name
+        cls._logger = Environment.get_default_logger()
+        try:
+            cls._sys_admin_client = Environment.get_sys_admin_client()
+            cls._org_client = Environment.get_client_in_default_org(
+                cls._test_runner_role)
+            cls._org = Environment.get_test_org(cls._sys_admin_client)
+            cls._vdc = Environment.get_test_vdc(cls._org_client)
+            cls._platform = Platform(cls._sys_admin_client)
+            cls._create_fixtures()
+        except Exception:
+            # unittest doesn't call tearDownClass() if setUpClass() fails, so
+            # remove whatever got created before the failure ourselves. A
+            # failing cleanup must not hide the setup failure.
+            try:
+                cls.tearDownClass()
+            except Exception:
+                cls._logger.warning(
+                    'Cleanup after failed setup of %s failed.',
+                    cls.__name__, exc_info=True)
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._teardown_errors = []
+        try:
+            cls._delete_fixtures()
+        finally:
+            if cls._org_client is not None:
+                cls._org_client.logout()
+            if cls._sys_admin_client is not None:
+                cls._sys_admin_client.logout()
+            super().tearDownClass()
+        # _delete_fixtures() carries on past failures so that it removes as
+        # much as it can, report the first one so that a leak doesn't go
+        # unnoticed.
+        if len(cls._teardown_errors) > 0:
+            raise cls._teardown_errors[0]
+
+    @classmethod
+    def _create_fixtures(cls):
+        """Create the org vdc, vApp and resource pools needed by this module.
+
+        Create one org vdc and a vApp with just one vm as per the
+        configuration stated above, and attach the resource pools listed in
+        the configuration to the PVDC.
+
+        The org vdc and the vApp don't depend on each other, so both tasks
+        are started first and then waited on together. The resource pools
+        are only attached after that: the vm has to be placed on the PVDC's
+        existing resource pool, the one migrations start from, and the org
+        vdc creation shouldn't run into an attach in progress on the same
+        PVDC.
+        """
+        logger = cls._logger
+        org = cls._org
+        platform = cls._platform
+
+        pvdc_config = Environment.get_config()['pvdc']
+        cls._pvdc_name = pvdc_config['pvdc_name']
+        cls._resource_pool_names = pvdc_config['respools_to_attach']
+        cls._vms_to_migrate = [cls._test_vapp_first_vm_name]
+        cls._target_resource_pool = pvdc_config['target_resource_pool']
+        cls._storage_profiles = pvdc_config['storage_profiles']
+
+        vdc_name = cls._new_vdc_name
         pvdc_name = Environment.get_test_pvdc_name()
         provider_vdc = platform.get_ref_by_name(ResourceType.PROVIDER_VDC,
                                                 pvdc_name)
         pvdc_ext_href = get_admin_extension_href(provider_vdc.get('href'))
-        pvdc_ext_resource = TestPVDC._sys_admin_client.get_resource(
-            pvdc_ext_href)
+        pvdc_ext_resource = cls._sys_admin_client.get_resource(pvdc_ext_href)
         vc_name = pvdc_ext_resource.VimServer.get('name')
-        res_pools_in_pvdc = TestPVDC._sys_admin_client.get_linked_resource(
+        res_pools_in_pvdc = cls._sys_admin_client.get_linked_resource(
             resource=pvdc_ext_resource,
             rel=RelationType.DOWN,
             media_type=EntityType.VMW_PROVIDER_VDC_RESOURCE_POOL_SET.value)
@@ -97,7 +168,7 @@ class TestPVDC(BaseTestCase):
                    '{' + NSMAP['vmext'] + '}VMWProviderVdcResourcePool'):
             src_respool = res_pools_in_pvdc.VMWProviderVdcResourcePool[0]
         name_filter = ('vcName', vc_name)
-        query = TestPVDC._sys_admin_client.get_typed_query(
+        query = cls._sys_admin_client.get_typed_query(
             ResourceType.RESOURCE_POOL.value,
             query_result_format=QueryResultFormat.RECORDS,
             equality_filter=name_filter)
@@ -106,7 +177,7 @@ class TestPVDC(BaseTestCase):
             res_pools_in_use[res_pool.get('moref')] = res_pool.get('name')
         source_respool_name = res_pools_in_use[
             src_respool.ResourcePoolVimObjectRef.MoRef]
-        TestPVDC._source_resource_pool = source_respool_name
+        cls._source_resource_pool = source_respool_name
 
         storage_profiles = [{
             'name': '*',
@@ -115,95 +186,209 @@ class TestPVDC(BaseTestCase):
             'limit': 0,
             'default': True
         }]
-        vdc_resource = org.create_org_vdc(
-            vdc_name,
-            pvdc_name,
-            storage_profiles=storage_profiles,
-            uses_fast_provisioning=True,
-            is_thin_provision=True)
-        TestPVDC._sys_admin_client.get_task_monitor().wait_for_success(
-            task=vdc_resource.Tasks.Task[0])
-
-        logger.debug('Created ovdc ' + vdc_name + '.')
-
-        # The following contraption is required to get the non admin href of
-        # the ovdc. vdc_resource contains the admin version of the href since
-        # we created the ovdc as a sys admin.
-        org.reload()
-        for vdc in org.list_vdcs():
-            if vdc.get('name').lower() == vdc_name.lower():
-                TestPVDC._new_vdc_href = vdc.get('href')
-
-        self.assertIsNotNone(TestPVDC._new_vdc_href)
+        # Each task is recorded as soon as it is started. If starting a
+        # later one fails, the started ones are waited on before re-raising,
+        # so that the cleanup doesn't find the entities still busy being
+        # created. Tasks that couldn't be waited on are left in _setup_tasks
+        # for _delete_fixtures().
+        cls._setup_tasks = tasks = []
+        try:
+            vdc_resource = org.create_org_vdc(
+                vdc_name,
+                pvdc_name,
+                storage_profiles=storage_profiles,
+                uses_fast_provisioning=True,
+                is_thin_provision=True)
+            tasks.append(vdc_resource.Tasks.Task[0])
+            # The hrefs are recorded as soon as the entities exist, so that
+            # _delete_fixtures() can find them even if a later step fails.
+            # vdc_resource contains the admin version of the href since we
+            # created the ovdc as a sys admin, derive the non admin href from
+            # it.
+            cls._new_vdc_href = get_non_admin_href(vdc_resource.get('href'))
+
+            logger.debug('Creating vApp %s.', cls._test_vapp_name)
+            vapp_sparse_resource = instantiate_customized_vapp_from_template(
+                vdc=cls._vdc,
+                name=cls._test_vapp_name,
+                catalog_name=Environment.get_default_catalog_name(),
+                template_name=Environment.get_default_template_name(),
+                memory_size=cls._test_vapp_first_vm_memory_size,
+                num_cpu=cls._test_vapp_first_vm_num_cpu,
+                disk_size=cls._test_vapp_first_vm_first_disk_size,
+                vm_name=cls._test_vapp_first_vm_name,
+                nw_adapter_type=cls._test_vapp_first_vm_network_adapter_type)
+            tasks.append(vapp_sparse_resource.Tasks.Task[0])
+            cls._test_vapp_href = vapp_sparse_resource.get('href')
+        except Exception:
+            try:
+                wait_for_tasks(cls._sys_admin_client, tasks)
+                cls._setup_tasks = None
+            except Exception:
+                logger.warning('Setup task of %s failed.', cls.__name__,
+                               exc_info=True)
+            raise
+
+        # wait_for_tasks raises if any of the tasks fails.
+        wait_for_tasks(cls._sys_admin_client, tasks)
+        cls._setup_tasks = None
+        logger.debug('Created ovdc %s.', vdc_name)
+
+        attach_task = platform.attach_resource_pools_to_provider_vdc(
+            cls._pvdc_name, cls._resource_pool_names)
+        cls._setup_tasks = [attach_task]
+        wait_for_task_success(cls._sys_admin_client, attach_task)
+        cls._setup_tasks = None
+
+        vapp = VApp(cls._org_client, href=cls._test_vapp_href)
+        vm_resource = vapp.get_vm(cls._test_vapp_first_vm_name)
+        cls._test_vapp_first_vm_href = vm_resource.get('href')
+
+    @classmethod
+    @developerModeAware
+    def _delete_fixtures(cls):
+        """Delete the fixtures created by _create_fixtures().
 
-    def test_0010_vm_setup(self):
-        """Setup the vms required for the other tests in this module.
+        Deletes the vApp and the org vdc, and detaches the configured
+        resource pools that are still attached to the PVDC.
 
-        Create a vApp with just one vm as per the configuration stated above.
+        The vApp lives in the default test vdc, so the two deletes don't
+        depend on each other; all the tasks are started first and then
+        waited on together.
 
-        This test passes if the vApp and vm hrefs are not None.
+        Each entity is deleted independently and failures are logged and
+        collected in _teardown_errors, so that whatever could be created,
+        even by a setup that failed part way, gets removed. Setup tasks that
+        may still be running are waited on first, since vCD refuses to delete
+        an entity that is still busy being created.
         """
-        logger = Environment.get_default_logger()
-        TestPVDC._org_client = Environment.get_client_in_default_org(
-            TestPVDC._test_runner_role)
-        vdc = Environment.get_test_vdc(TestPVDC._org_client)
-
-        logger.debug('Creating vApp ' + TestPVDC._test_vapp_name + '.')
-        TestPVDC._test_vapp_href = create_customized_vapp_from_template(
-            client=TestPVDC._org_client,
-            vdc=vdc,
-            name=TestPVDC._test_vapp_name,
-            catalog_name=Environment.get_default_catalog_name(),
-            template_name=Environment.get_default_template_name(),
-            memory_size=TestPVDC._test_vapp_first_vm_memory_size,
-            num_cpu=TestPVDC._test_vapp_first_vm_num_cpu,
-            disk_size=TestPVDC._test_vapp_first_vm_first_disk_size,
-            vm_name=TestPVDC._test_vapp_first_vm_name,
-            nw_adapter_type=TestPVDC._test_vapp_first_vm_network_adapter_type)
+        logger = cls._logger
+        errors = cls._teardown_errors
+        if cls._setup_tasks:
+            # wait_for_tasks only raises once all the tasks are done.
+            try:
+                wait_for_tasks(cls._sys_admin_client, cls._setup_tasks)
+            except Exception:
+                logger.warning('Setup task of %s failed.', cls.__name__,
+                               exc_info=True)
+            cls._setup_tasks = None
+
+        tasks = []
+        if cls._test_vapp_href is not None:
+            try:
+                tasks.append(
+                    cls._vdc.delete_vapp(
+                        name=cls._test_vapp_name, force=True))
+            except Exception as e:
+                logger.warning('Failed to delete vApp %s.',
+                               cls._test_vapp_name, exc_info=True)
+                errors.append(e)
+
+        if cls._new_vdc_href is not None:
+            try:
+                vdc = VDC(cls._sys_admin_client, href=cls._new_vdc_href)
+                # Disable the org vdc before deleting it. In case the org vdc
+                # is already disabled, we don't want the exception to leak
+                # out.
+                try:
+                    vdc.enable_vdc(enable=False)
+                    logger.debug('Disabled vdc %s.', cls._new_vdc_name)
+                except OperationNotSupportedException:
+                    logger.debug('vdc %s is already disabled.',
+                                 cls._new_vdc_name)
+                tasks.append(vdc.delete_vdc())
+            except Exception as e:
+                logger.warning('Failed to delete vdc %s.',
+                               cls._new_vdc_name, exc_info=True)
+                errors.append(e)
+
+        # wait_for_tasks only raises once all the tasks are done.
+        try:
+            wait_for_tasks(cls._sys_admin_client, tasks)
+            logger.debug('Deleted TestPVDC fixtures.')
+        except Exception as e:
+            logger.warning('Failed to delete TestPVDC fixtures.',
+                           exc_info=True)
+            errors.append(e)
+
+        # test_0060_detach_resource_pools normally detaches the pools, but
+        # it may have failed or not run at all. The pools can only be
+        # detached once the vms on them are gone, hence after the deletes.
+        if cls._resource_pool_names:
+            try:
+                attached_pool_names = cls._get_attached_resource_pool_names()
+                pool_names = [
+                    pool_name for pool_name in cls._resource_pool_names
+                    if pool_name in attached_pool_names
+                ]
+                if len(pool_names) > 0:
+                    platform = cls._platform
+                    task = platform.detach_resource_pools_from_provider_vdc(
+                        cls._pvdc_name, pool_names)
+                    wait_for_task_success(cls._sys_admin_client, task)
+                    logger.debug('Detached resource pools %s.', pool_names)
+            except Exception as e:
+                logger.warning('Failed to detach resource pools %s.',
+                               cls._resource_pool_names, exc_info=True)
+                errors.append(e)
+
+    @classmethod
+    def _get_attached_resource_pool_names(cls):
+        """Get the names of the resource pools attached to the test PVDC.
+
+        :return: names of the resource pools.
+
+        :rtype: set
+        """
+        _, _, pvdc_ext_resource = cls._platform.get_pvdc(cls._pvdc_name)
+        res_pools_in_pvdc = cls._sys_admin_client.get_linked_resource(
+            resource=pvdc_ext_resource,
+            rel=RelationType.DOWN,
+            media_type=EntityType.VMW_PROVIDER_VDC_RESOURCE_POOL_SET.value)
+        if not hasattr(res_pools_in_pvdc,
+                       '{' + NSMAP['vmext'] + '}VMWProviderVdcResourcePool'):
+            return set()
+        attached_morefs = set()
+        for res_pool in res_pools_in_pvdc.VMWProviderVdcResourcePool:
+            attached_morefs.add(res_pool.ResourcePoolVimObjectRef.MoRef.text)
+
+        name_filter = ('vcName', pvdc_ext_resource.VimServer.get('name'))
+        query = cls._sys_admin_client.get_typed_query(
+            ResourceType.RESOURCE_POOL.value,
+            query_result_format=QueryResultFormat.RECORDS,
+            equality_filter=name_filter)
+        return {
+            res_pool.get('name')
+            for res_pool in query.execute()
+            if res_pool.get('moref') in attached_morefs
+        }
 
-        self.assertIsNotNone(TestPVDC._test_vapp_href)
+    def test_0000_setup(self):
+        """Check the org vdc, vApp and vm created by setUpClass.
 
-        vapp = VApp(TestPVDC._org_client, href=TestPVDC._test_vapp_href)
-        vm_resource = vapp.get_vm(TestPVDC._test_vapp_first_vm_name)
-        TestPVDC._test_vapp_first_vm_href = vm_resource.get('href')
+        Test the methods Org.create_org_vdc() and
+        Platform.attach_resource_pools_to_provider_vdc(), whose tasks are
+        run by setUpClass.
 
+        This test passes if the vdc, vApp and vm hrefs are not None.
+        """
+        self.assertIsNotNone(TestPVDC._new_vdc_href)
+        self.assertIsNotNone(TestPVDC._test_vapp_href)
         self.assertIsNotNone(TestPVDC._test_vapp_first_vm_href)
 
-    def test_0020_pvdc_setup(self):
-        TestPVDC._config = Environment.get_config()
-        TestPVDC._pvdc_name = self._config['pvdc']['pvdc_name']
-        TestPVDC._resource_pool_names = \
-            self._config['pvdc']['respools_to_attach']
-        TestPVDC._vms_to_migrate = []
-        TestPVDC._vms_to_migrate.append(TestPVDC._test_vapp_first_vm_name)
-        TestPVDC._target_resource_pool = \
-            self._config['pvdc']['target_resource_pool']
-        TestPVDC._storage_profiles = \
-            self._config['pvdc']['storage_profiles']
-
-    def test_0030_attach_resource_pools(self):
-        """Attach resource pool(s) to a PVDC."""
-        platform = Platform(TestPVDC._sys_admin_client)
-        task = platform.attach_resource_pools_to_provider_vdc(
-            TestPVDC._pvdc_name,
-            TestPVDC._resource_pool_names)
-        res = TestPVDC._sys_admin_client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(res.get('status'), TaskStatus.SUCCESS.value)
-
     def test_0035_add_storage_profile(self):
         """Add storage profile(s) to a PVDC."""
-        platform = Platform(TestPVDC._sys_admin_client)
+        platform = TestPVDC._platform
         task = platform.pvdc_add_storage_profile(
             TestPVDC._pvdc_name,
             TestPVDC._storage_profiles)
-        res = TestPVDC._sys_admin_client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(res.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestPVDC._sys_admin_client, task),
+            TaskStatus.SUCCESS.value)
 
     def test_0036_get_storage_profiles(self):
         """Get storage profile(s) of a PVDC."""
-        platform = Platform(TestPVDC._sys_admin_client)
+        platform = TestPVDC._platform
         _, _, pvdc_ext_res = platform.get_pvdc(TestPVDC._pvdc_name)
         pvdc = PVDC(TestPVDC._sys_admin_client, resource=pvdc_ext_res)
         pvdc_storage_profiles = pvdc.get_storage_profiles()
@@ -211,7 +396,7 @@ class TestPVDC(BaseTestCase):
 
     def test_0037_get_storage_profile(self):
         """Get a storage profile of a PVDC by name."""
-        platform = Platform(TestPVDC._sys_admin_client)
+        platform = TestPVDC._platform
         _, _, pvdc_ext_res = platform.get_pvdc(TestPVDC._pvdc_name)
         pvdc = PVDC(TestPVDC._sys_admin_client, resource=pvdc_ext_res)
         pvdc_storage_profile = pvdc.get_storage_profile(
@@ -221,7 +406,7 @@ class TestPVDC(BaseTestCase):
     def test_0038_get_storage_profile_negative(self):
         """PVDC.get_storage_profile does not find a non-existent profile."""
         try:
-            platform = Platform(TestPVDC._sys_admin_client)
+            platform = TestPVDC._platform
             _, _, pvdc_ext_res = platform.get_pvdc(TestPVDC._pvdc_name)
             pvdc = PVDC(TestPVDC._sys_admin_client, resource=pvdc_ext_res)
             pvdc.get_storage_profile(
@@ -232,95 +417,55 @@ class TestPVDC(BaseTestCase):
         except EntityNotFoundException as e:
             return
 
+    def _skip_if_nothing_to_migrate(self):
+        if not TestPVDC._vms_to_migrate or \
+           TestPVDC._source_resource_pool == TestPVDC._target_resource_pool:
+            self.skipTest('Nothing to migrate.')
+
     def test_0040_migrate_vms(self):
         """Migrate VM(s) from one resource pool to another."""
-        platform = Platform(TestPVDC._sys_admin_client)
+        self._skip_if_nothing_to_migrate()
+        platform = TestPVDC._platform
         task = platform.pvdc_migrate_vms(
             TestPVDC._pvdc_name,
             TestPVDC._vms_to_migrate,
             TestPVDC._source_resource_pool,
             TestPVDC._target_resource_pool)
-        res = TestPVDC._sys_admin_client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(res.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestPVDC._sys_admin_client, task),
+            TaskStatus.SUCCESS.value)
 
     def test_0050_migrate_vms_back(self):
         """Migrate VM(s) from one resource pool to another."""
-        platform = Platform(TestPVDC._sys_admin_client)
+        self._skip_if_nothing_to_migrate()
+        platform = TestPVDC._platform
         task = platform.pvdc_migrate_vms(
             TestPVDC._pvdc_name,
             TestPVDC._vms_to_migrate,
             TestPVDC._target_resource_pool)
-        res = TestPVDC._sys_admin_client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(res.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestPVDC._sys_admin_client, task),
+            TaskStatus.SUCCESS.value)
 
     def test_0055_del_storage_profile(self):
         """Delete storage profile(s) from a PVDC."""
-        platform = Platform(TestPVDC._sys_admin_client)
+        platform = TestPVDC._platform
         task = platform.pvdc_del_storage_profile(
             TestPVDC._pvdc_name,
             TestPVDC._storage_profiles)
-        res = TestPVDC._sys_admin_client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(res.get('status'), TaskStatus.SUCCESS.value)
+        self.assertEqual(
+            wait_for_success_status(TestPVDC._sys_admin_client, task),
+            TaskStatus.SUCCESS.value)
 
     def test_0060_detach_resource_pools(self):
         """Disable and delete resource pool(s) from a PVDC."""
-        platform = Platform(TestPVDC._sys_admin_client)
+        platform = TestPVDC._platform
         task = platform.detach_resource_pools_from_provider_vdc(
             TestPVDC._pvdc_name,
             TestPVDC._resource_pool_names)
-        res = TestPVDC._sys_admin_client.get_task_monitor().wait_for_success(
-            task=task)
-        self.assertEqual(res.get('status'), TaskStatus.SUCCESS.value)
-
-    @developerModeAware
-    def test_9997_teardown(self):
-        """Delete the vApp created during setup.
-
-        This test passes if the task for deleting the vApp succeed.
-        """
-        vapps_to_delete = []
-        if TestPVDC._test_vapp_href is not None:
-            vapps_to_delete.append(TestPVDC._test_vapp_name)
-
-        vdc = Environment.get_test_vdc(TestPVDC._org_client)
-
-        for vapp_name in vapps_to_delete:
-            task = vdc.delete_vapp(name=vapp_name, force=True)
-            result = TestPVDC._org_client.get_task_monitor().wait_for_success(
-                task)
-            self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
-
-    @developerModeAware
-    def test_9998_teardown(self):
-        """Test the method VDC.delete_vdc().
-
-        Invoke the method for the vdc created by setup.
-
-        This test passes if the task for deleting the vdc succeeds.
-        """
-        logger = Environment.get_default_logger()
-        vdc = VDC(TestPVDC._sys_admin_client, href=TestPVDC._new_vdc_href)
-        # Disable the org vdc before deleting it. In case the org vdc is
-        # already disabled, we don't want the exception to leak out.
-        try:
-            vdc.enable_vdc(enable=False)
-            logger.debug('Disabled vdc ' + TestPVDC._new_vdc_name + '.')
-        except OperationNotSupportedException:
-            logger.debug('vdc ' + TestPVDC._new_vdc_name +
-                         ' is already disabled.')
-            pass
-        task = vdc.delete_vdc()
-        TestPVDC._sys_admin_client.get_task_monitor().wait_for_success(
-            task=task)
-        logger.debug('Deleted vdc ' + TestPVDC._new_vdc_name + '.')
-
-    def test_9999_cleanup(self):
-        """Release all resources held by this object for testing purposes."""
-        TestPVDC._org_client.logout()
-        TestPVDC._sys_admin_client.logout()
+        self.assertEqual(
+            wait_for_success_status(TestPVDC._sys_admin_client, task),
+            TaskStatus.SUCCESS.value)
 
 
 if __name__ == '__main__':
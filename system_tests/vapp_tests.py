@@ -70,6 +70,9 @@ class TestVApp(BaseTestCase):
     _customized_vapp_owner_name = None
     _customized_vapp_href = None
 
+    _multi_vm_vapp_name = 'multi_vm_vApp_' + str(uuid1())
+    _multi_vm_vapp_vm_names = ['multi-vm-1', 'multi-vm-2', 'multi-vm-3']
+
     _non_existent_vapp_name = 'non_existent_vapp_' + str(uuid1())
 
     _metadata_key = 'key_' + str(uuid1())
@@ -286,6 +289,39 @@ class TestVApp(BaseTestCase):
         self.assertEqual(disk_size,
                          (TestVApp._customized_vapp_disk_size * 1024 * 1024))
 
+    def test_0045_multi_vm_customized_vapp(self):
+        """Test create_customized_vapp_from_template() with several vms.
+
+        This test passes if the vApp is created with all the requested vms,
+        the vms after the first one being added by a single recompose.
+        """
+        vdc = Environment.get_test_vdc(TestVApp._client)
+        vm_names = TestVApp._multi_vm_vapp_vm_names
+        vms = [{
+            'memory_size': TestVApp._customized_vapp_memory_size,
+            'num_cpu': TestVApp._customized_vapp_num_cpu,
+            'vm_name': vm_names[0]
+        }]
+        vms.extend({'vm_name': vm_name} for vm_name in vm_names[1:])
+
+        vapp_href = create_customized_vapp_from_template(
+            client=TestVApp._client,
+            vdc=vdc,
+            name=TestVApp._multi_vm_vapp_name,
+            catalog_name=Environment.get_default_catalog_name(),
+            template_name=Environment.get_default_template_name(),
+            vms=vms)
+        try:
+            vapp = VApp(TestVApp._client, href=vapp_href)
+            self.assertEqual(
+                sorted(vm.get('name') for vm in vapp.get_all_vms()),
+                sorted(vm_names))
+        finally:
+            task = vdc.delete_vapp(
+                name=TestVApp._multi_vm_vapp_name, force=True)
+            result = TestVApp._client.get_task_monitor().wait_for_success(task)
+            self.assertEqual(result.get('status'), TaskStatus.SUCCESS.value)
+
     def test_0050_vapp_power_options(self):
         """Test the method related to power operations in vapp.py.
 